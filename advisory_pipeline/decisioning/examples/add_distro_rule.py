@@ -7,7 +7,7 @@ Copy this pattern to add any new rule.
 
 To integrate:
 1. Copy DistroNotAffectedRule class to decisioning/rules.py
-2. Add to get_default_rules() with priority 3
+2. Add to _DEFAULT_RULES in rules.py with priority 3
 3. Update dbt enrichment to include distro fields
 4. Add explanation template to config.yaml
 5. Write tests
@@ -4,14 +4,43 @@ Explanation generator for advisory decisions.
 Produces human-readable explanations from decision data using
 templates and evidence.
 """
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from datetime import datetime
+from string import Formatter
 import logging
 
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Pre-parse a template into a renderer over prepared values.
+
+    Plain ``{name}`` fields are resolved by direct lookup; templates using
+    format specs, conversions, or attribute/index access fall back to
+    str.format. Either way a missing field raises KeyError.
+    """
+    try:
+        parts = tuple(Formatter().parse(template))
+    except ValueError:
+        return lambda values: template.format(**values)
+
+    for _, field, spec, conversion in parts:
+        if field is not None and (
+            spec or conversion or not field.isidentifier()
+        ):
+            return lambda values: template.format(**values)
+
+    def render(values: Dict[str, str]) -> str:
+        return ''.join(
+            literal if field is None else literal + values[field]
+            for literal, field, _, _ in parts
+        )
+
+    return render
+
+
 class DecisionExplainer:
     """
     Generates customer-facing explanations for advisory decisions.
@@ -61,6 +90,22 @@ class DecisionExplainer:
                       If None, uses default templates.
         """
         self.templates = templates or self.DEFAULT_TEMPLATES
+        self._renderers = {
+            code: _compile_template(template)
+            for code, template in self.templates.items()
+        }
+        self._default_renderer = self._renderers.get('DEFAULT', lambda values: '')
+
+        # Explanations for calls with no evidence and no fixed version depend
+        # only on the template, so render them once up front
+        default_values = self._prepare_values({}, None)
+        self._all_defaults: Dict[str, str] = {}
+        for code, render in self._renderers.items():
+            try:
+                self._all_defaults[code] = render(default_values).strip()
+            except (KeyError, IndexError, ValueError):
+                # Left to explain() so its usual error handling applies
+                continue
 
     def explain(
         self,
@@ -79,13 +124,18 @@ class DecisionExplainer:
         Returns:
             Human-readable explanation string
         """
-        template = self.templates.get(reason_code, self.templates.get('DEFAULT', ''))
+        if not evidence and fixed_version is None:
+            explanation = self._all_defaults.get(reason_code)
+            if explanation is not None:
+                return explanation
+
+        render = self._renderers.get(reason_code, self._default_renderer)
 
         # Prepare substitution values
         values = self._prepare_values(evidence, fixed_version)
 
         try:
-            explanation = template.format(**values)
+            explanation = render(values)
             return explanation.strip()
         except KeyError as e:
             logger.warning(
@@ -5,14 +5,19 @@ The engine applies rules in priority order (lowest first) and returns
 the first matching decision. This implements a deterministic,
 explainable decision-making process.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import logging
+import os
 
 from .rules import Rule, Decision, get_default_rules
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many advisories, thread pool startup outweighs any overlap
+PARALLEL_BATCH_THRESHOLD = 64
+
 
 class RuleEngine:
     """
@@ -30,6 +35,9 @@ class RuleEngine:
             rules: List of rules to evaluate. If None, uses default rules.
         """
         self.rules = sorted(rules or get_default_rules(), key=lambda r: r.priority)
+        # Priority-ordered (rule_id, evaluate) pairs, bound once so the
+        # per-advisory loop skips repeated attribute lookups
+        self._chain = tuple((rule.rule_id, rule.evaluate) for rule in self.rules)
 
     def decide(self, advisory_data: Dict[str, Any]) -> Decision:
         """
@@ -46,20 +54,22 @@ class RuleEngine:
         """
         advisory_id = advisory_data.get('advisory_id', 'unknown')
 
-        for rule in self.rules:
+        for rule_id, evaluate in self._chain:
             try:
-                decision = rule.evaluate(advisory_data)
+                decision = evaluate(advisory_data)
                 if decision:
+                    # Lazy %-args: nothing is formatted unless DEBUG is enabled
                     logger.debug(
-                        f"Advisory {advisory_id}: Rule {rule.rule_id} matched -> {decision.state}"
+                        "Advisory %s: Rule %s matched -> %s",
+                        advisory_id, rule_id, decision.state
                     )
                     # Add rule ID to decision metadata
-                    decision.evidence['applied_rule'] = rule.rule_id
+                    decision.evidence['applied_rule'] = rule_id
                     return decision
 
             except Exception as e:
                 logger.error(
-                    f"Error evaluating rule {rule.rule_id} for advisory {advisory_id}: {e}",
+                    f"Error evaluating rule {rule_id} for advisory {advisory_id}: {e}",
                     exc_info=True
                 )
                 continue
@@ -67,30 +77,40 @@ class RuleEngine:
         # Should never reach here if fallback rule is present
         raise ValueError(f"No rule matched for advisory {advisory_id}")
 
-    def decide_batch(self, advisories: List[Dict[str, Any]]) -> List[Decision]:
+    def decide_batch(
+        self,
+        advisories: List[Dict[str, Any]],
+        parallel: bool = False
+    ) -> List[Decision]:
         """
         Apply rule chain to multiple advisories.
 
         Args:
             advisories: List of enriched advisory data
+            parallel: If True and the batch is large, evaluate advisories on a
+                      thread pool. Only worthwhile when rules wait on I/O;
+                      pure in-memory rules are faster serially.
 
         Returns:
             List of decisions in same order as input
         """
-        decisions = []
-        for advisory in advisories:
-            try:
-                decision = self.decide(advisory)
-                decisions.append(decision)
-            except Exception as e:
-                logger.error(
-                    f"Failed to decide for advisory {advisory.get('advisory_id')}: {e}",
-                    exc_info=True
-                )
-                # Add error decision
-                decisions.append(self._create_error_decision(advisory, str(e)))
-
-        return decisions
+        if parallel and len(advisories) > PARALLEL_BATCH_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(executor.map(self._decide_or_error, advisories))
+
+        decide = self._decide_or_error
+        return [decide(advisory) for advisory in advisories]
+
+    def _decide_or_error(self, advisory: Dict[str, Any]) -> Decision:
+        """Decide one advisory, turning failures into an error decision."""
+        try:
+            return self.decide(advisory)
+        except Exception as e:
+            logger.error(
+                f"Failed to decide for advisory {advisory.get('advisory_id')}: {e}",
+                exc_info=True
+            )
+            return self._create_error_decision(advisory, str(e))
 
     def _create_error_decision(self, advisory_data: Dict[str, Any], error: str) -> Decision:
         """Create a fallback decision when processing fails."""
@@ -109,12 +129,19 @@ class RuleEngine:
             dissenting_sources=[]
         )
 
-    def explain_decision(self, advisory_data: Dict[str, Any]) -> Dict[str, Any]:
+    def explain_decision(
+        self,
+        advisory_data: Dict[str, Any],
+        *,
+        stop_after_match: bool = False
+    ) -> Dict[str, Any]:
         """
         Get detailed explanation of decision process.
 
         Args:
             advisory_data: Enriched advisory data
+            stop_after_match: If True, stop evaluating after the first matching
+                rule instead of tracing the full chain
 
         Returns:
             Dictionary with decision, matching rule, and evaluation trace
@@ -135,6 +162,8 @@ class RuleEngine:
                 if decision and matched_decision is None:
                     matched_decision = decision
                     decision.evidence['applied_rule'] = rule.rule_id
+                    if stop_after_match:
+                        break
 
             except Exception as e:
                 trace.append({
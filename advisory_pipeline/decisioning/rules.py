@@ -5,7 +5,7 @@ Each rule evaluates enriched advisory data and returns a decision
 if the rule conditions are met, or None if the rule doesn't apply.
 """
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -200,16 +200,29 @@ class PendingUpstreamRule(Rule):
         )
 
 
-def get_default_rules() -> List[Rule]:
+# Rules hold no per-advisory state, so one shared instance of each is enough
+_DEFAULT_RULES: Tuple[Rule, ...] = (
+    CsvOverrideRule(),        # R0 (priority 0): Internal override - highest
+    NvdRejectedRule(),        # R1 (priority 1): NVD rejected
+    UpstreamFixRule(),        # R2 (priority 2): Fix available
+    # ADD NEW RULES HERE (priority 3-4 for distro-specific rules)
+    # Example: DistroNotAffectedRule(),
+    UnderInvestigationRule(), # R5 (priority 5): No signals yet
+    PendingUpstreamRule(),    # R6 (priority 6): Default fallback - always matches
+)
+
+
+def get_default_rules() -> Tuple[Rule, ...]:
     """
     Get the default rule chain in priority order.
 
     Rules are evaluated in order (lowest priority number first).
-    First rule that matches determines the final state.
+    First rule that matches determines the final state. The same
+    immutable tuple is returned on every call.
 
     To add a new rule:
     1. Create a class extending Rule (see extending.md)
-    2. Add instance here with appropriate priority
+    2. Add instance to _DEFAULT_RULES with appropriate priority
     3. Add tests in tests/test_decisioning_rules.py
 
     Example:
@@ -217,15 +230,7 @@ def get_default_rules() -> List[Rule]:
         # DistroNotAffectedRule(),  # Priority 3
         # DistroWontFixRule(),       # Priority 4
     """
-    return [
-        CsvOverrideRule(),        # R0 (priority 0): Internal override - highest
-        NvdRejectedRule(),        # R1 (priority 1): NVD rejected
-        UpstreamFixRule(),        # R2 (priority 2): Fix available
-        # ADD NEW RULES HERE (priority 3-4 for distro-specific rules)
-        # Example: DistroNotAffectedRule(),
-        UnderInvestigationRule(), # R5 (priority 5): No signals yet
-        PendingUpstreamRule(),    # R6 (priority 6): Default fallback - always matches
-    ]
+    return _DEFAULT_RULES
 
 
 # ==============================================================================
@@ -267,7 +272,7 @@ def get_default_rules() -> List[Rule]:
 #             dissenting_sources=[]
 #         )
 #
-# Then add to get_default_rules() above with appropriate priority.
+# Then add to _DEFAULT_RULES above with appropriate priority.
 # See extending.md for full guide with examples.
 # ==============================================================================
 
@@ -311,7 +316,7 @@ def get_default_rules() -> List[Rule]:
 #
 # To enable:
 # 1. Uncomment this class
-# 2. Add DistroNotAffectedRule() to get_default_rules() after UpstreamFixRule()
+# 2. Add DistroNotAffectedRule() to _DEFAULT_RULES after UpstreamFixRule()
 # 3. Add 'distro_status', 'distro_notes', 'distro' fields to dbt enrichment
 # 4. Add explanation template to config.yaml:
 #    DISTRO_NOT_AFFECTED: "Not affected in {distro}. Reason: {distro_notes}."
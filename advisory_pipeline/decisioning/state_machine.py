@@ -4,7 +4,8 @@ State machine for validating advisory state transitions.
 Ensures that state changes follow allowed transition paths and
 prevents invalid regressions (e.g., fixed -> pending_upstream).
 """
-from typing import Set, Dict, Optional, List, Any
+from types import MappingProxyType
+from typing import FrozenSet, Dict, Optional, Tuple, Any, Mapping
 from enum import Enum
 import logging
 
@@ -33,8 +34,8 @@ class AdvisoryStateMachine:
     - Final -> Non-final: Rejected (regression)
     """
 
-    FINAL_STATES: Set[str] = {'fixed', 'not_applicable', 'wont_fix'}
-    NON_FINAL_STATES: Set[str] = {'pending_upstream', 'under_investigation', 'unknown'}
+    FINAL_STATES: FrozenSet[str] = frozenset({'fixed', 'not_applicable', 'wont_fix'})
+    NON_FINAL_STATES: FrozenSet[str] = frozenset({'pending_upstream', 'under_investigation', 'unknown'})
 
     def __init__(self, config: Optional[Dict] = None):
         """
@@ -44,13 +45,36 @@ class AdvisoryStateMachine:
             config: Optional configuration with custom state definitions
         """
         if config:
-            self.final_states = set(config.get('final', self.FINAL_STATES))
-            self.non_final_states = set(config.get('non_final', self.NON_FINAL_STATES))
+            self.final_states = frozenset(config.get('final', self.FINAL_STATES))
+            self.non_final_states = frozenset(config.get('non_final', self.NON_FINAL_STATES))
         else:
             self.final_states = self.FINAL_STATES
             self.non_final_states = self.NON_FINAL_STATES
 
         self.all_states = self.final_states | self.non_final_states
+        self._state_types: Dict[str, StateType] = {
+            **{state: StateType.NON_FINAL for state in self.non_final_states},
+            **{state: StateType.FINAL for state in self.final_states},
+        }
+
+        # Every (current, new) pair allowed without allow_regressions, so
+        # validate_transition is a single set lookup; None marks a new advisory
+        self._allowed_transitions = frozenset(
+            (current, new)
+            for current in (*self.all_states, None)
+            for new in self.all_states
+            if current not in self.final_states or new in self.final_states
+        )
+
+        # Allowed targets per known state, and memoized describe_transition results
+        self._targets_by_state: Dict[str, Tuple[str, ...]] = {
+            state: tuple(
+                new for new in self.all_states
+                if (state, new) in self._allowed_transitions
+            )
+            for state in self.all_states
+        }
+        self._descriptions: Dict[Tuple[Optional[str], str], Mapping[str, Any]] = {}
 
     def validate_transition(
         self,
@@ -71,97 +95,72 @@ class AdvisoryStateMachine:
             - is_valid: True if transition is allowed
             - reason: Explanation if transition is rejected, None otherwise
         """
+        if (current_state, new_state) in self._allowed_transitions:
+            # Final -> Final: Allowed but log
+            if current_state != new_state and current_state in self.final_states:
+                logger.info(
+                    f"Final state change: {current_state} -> {new_state}"
+                )
+            return True, None
+
         # Validate states exist
         if new_state not in self.all_states:
             return False, f"Invalid target state: {new_state}"
 
-        # New advisory - always allowed
-        if current_state is None:
-            return True, None
-
         if current_state not in self.all_states:
             return False, f"Invalid current state: {current_state}"
 
-        # Same state - always allowed
-        if current_state == new_state:
+        # Only Final -> Non-final remains: Regression (usually not allowed)
+        if allow_regressions:
+            logger.warning(
+                f"Allowing regression: {current_state} -> {new_state}"
+            )
             return True, None
 
-        current_is_final = current_state in self.final_states
-        new_is_final = new_state in self.final_states
-
-        # Non-final -> Any: Allowed
-        if not current_is_final:
-            return True, None
-
-        # Final -> Non-final: Regression (usually not allowed)
-        if current_is_final and not new_is_final:
-            if allow_regressions:
-                logger.warning(
-                    f"Allowing regression: {current_state} -> {new_state}"
-                )
-                return True, None
-            else:
-                return False, f"Regression not allowed: {current_state} (final) -> {new_state} (non-final)"
-
-        # Final -> Final: Allowed but log
-        if current_is_final and new_is_final:
-            if current_state != new_state:
-                logger.info(
-                    f"Final state change: {current_state} -> {new_state}"
-                )
-            return True, None
-
-        return True, None
+        return False, f"Regression not allowed: {current_state} (final) -> {new_state} (non-final)"
 
     def get_state_type(self, state: str) -> Optional[StateType]:
         """Get the type classification for a state."""
-        if state in self.final_states:
-            return StateType.FINAL
-        elif state in self.non_final_states:
-            return StateType.NON_FINAL
-        return None
+        return self._state_types.get(state)
 
     def is_final_state(self, state: str) -> bool:
         """Check if state is final/terminal."""
-        return state in self.final_states
+        return self._state_types.get(state) is StateType.FINAL
 
-    def get_allowed_transitions(self, current_state: str) -> List[str]:
+    def get_allowed_transitions(self, current_state: str) -> Tuple[str, ...]:
         """
-        Get list of allowed target states from current state.
+        Get allowed target states from current state.
 
         Args:
             current_state: Starting state
 
         Returns:
-            List of allowed target states
+            Tuple of allowed target states (empty for unknown states)
         """
-        if current_state not in self.all_states:
-            return []
-
-        if current_state in self.non_final_states:
-            # Non-final can transition to any state
-            return list(self.all_states)
-
-        if current_state in self.final_states:
-            # Final can only transition to other final states
-            return list(self.final_states)
-
-        return []
+        return self._targets_by_state.get(current_state, ())
 
     def describe_transition(
         self,
         current_state: Optional[str],
         new_state: str
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Describe a state transition with metadata.
 
+        Descriptions of transitions between known states are computed once
+        and shared, so the returned mapping is read-only.
+
         Returns:
-            Dictionary with transition details and validity
+            Read-only mapping with transition details and validity
         """
+        key = (current_state, new_state)
+        description = self._descriptions.get(key)
+        if description is not None:
+            return description
+
         is_valid, reason = self.validate_transition(current_state, new_state)
 
-        return {
+        description = MappingProxyType({
             'from_state': current_state,
             'to_state': new_state,
             'is_valid': is_valid,
@@ -172,4 +171,12 @@ class AdvisoryStateMachine:
                 current_state in self.final_states and
                 new_state in self.non_final_states
             ) if current_state else False
-        }
+        })
+
+        # Only cache the finite set of known-state pairs
+        if key in self._allowed_transitions or (
+            current_state in self.all_states and new_state in self.all_states
+        ):
+            self._descriptions[key] = description
+
+        return description
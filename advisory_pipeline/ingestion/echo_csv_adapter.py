@@ -6,11 +6,12 @@ Expected CSV columns: cve_id, package, status, fixed_version, internal_status
 """
 import csv
 import hashlib
+import io
 import logging
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from .base_adapter import BaseAdapter, SourceObservation
 
@@ -33,6 +34,8 @@ class EchoCsvAdapter(BaseAdapter):
         super().__init__(config)
         self.source_id = "echo_csv"
         self.path = Path(config.get("path", "../data/advisory-not-applicable.csv"))
+        # Raw CSV bytes to parse instead of reading self.path (e.g. preloaded by tests)
+        self.content: Optional[bytes] = config.get("content")
         self._previous_hash: Optional[str] = None
 
     def fetch(self) -> List[SourceObservation]:
@@ -40,18 +43,18 @@ class EchoCsvAdapter(BaseAdapter):
         self._last_fetch = datetime.utcnow()
 
         try:
-            if not self.path.exists():
+            if self.content is not None:
+                with io.TextIOWrapper(io.BytesIO(self.content), encoding='utf-8', newline='') as f:
+                    observations = list(self._iter_observations(f))
+
+            elif not self.path.exists():
                 # Return empty if no CSV exists yet
                 self._records_fetched = 0
                 return []
 
-            observations = []
-            with open(self.path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    obs = self.normalize(row)
-                    if obs:
-                        observations.append(obs)
+            else:
+                with open(self.path, 'r', newline='', encoding='utf-8') as f:
+                    observations = list(self._iter_observations(f))
 
             self._records_fetched = len(observations)
             self._last_error = None
@@ -65,6 +68,21 @@ class EchoCsvAdapter(BaseAdapter):
             logger.debug(f"Full traceback:\n{traceback.format_exc()}")
             return []
 
+    def _iter_observations(self, handle: Iterable[str]) -> Iterator[SourceObservation]:
+        """
+        Yield observations from an open CSV stream, one row at a time.
+
+        Args:
+            handle: Text stream (or any iterable of lines) with a header row
+
+        Yields:
+            Normalized observations for valid rows
+        """
+        for row in csv.DictReader(handle):
+            obs = self.normalize(row)
+            if obs:
+                yield obs
+
     def normalize(self, raw_record: Dict[str, Any], **kwargs) -> Optional[SourceObservation]:
         """
         Transform CSV row to normalized observation.
@@ -103,7 +121,7 @@ class EchoCsvAdapter(BaseAdapter):
             source_id=self.source_id,
             cve_id=cve_id,
             package_name=package_name,
-            observed_at=datetime.utcnow(),
+            observed_at=self._last_fetch or datetime.utcnow(),
             source_updated_at=None,  # CSV doesn't have timestamps
             raw_payload=raw_record,
             status=status if status else None,
@@ -113,6 +131,9 @@ class EchoCsvAdapter(BaseAdapter):
 
     def get_content_hash(self) -> Optional[str]:
         """Get hash of CSV contents for change detection."""
+        if self.content is not None:
+            return hashlib.md5(self.content).hexdigest()
+
         if not self.path.exists():
             return None
 
@@ -5,13 +5,15 @@ This represents Echo's published advisories before enrichment.
 The data.json structure is: {package_name: {cve_id: {fixed_version: ...}}}
 """
 import hashlib
+import itertools
 import json
 import logging
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import ijson
 import requests
 
 from .base_adapter import BaseAdapter, SourceObservation
@@ -45,10 +47,9 @@ class EchoDataAdapter(BaseAdapter):
         self._last_fetch = datetime.utcnow()
 
         try:
-            data = self._load_data()
             observations = []
 
-            for package_name, cves in data.items():
+            for package_name, cves in self._iter_packages():
                 if not isinstance(cves, dict):
                     continue
 
@@ -69,13 +70,31 @@ class EchoDataAdapter(BaseAdapter):
             logger.debug(f"Full traceback:\n{traceback.format_exc()}")
             return []
 
-    def _load_data(self) -> Dict[str, Any]:
-        """Load from cache, falling back to URL if needed."""
+    def _iter_packages(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (package_name, cves) pairs from cache, falling back to URL.
+
+        The cached file is streamed one package at a time, so the full
+        corpus is never held in memory as a single parsed document.
+
+        Raises:
+            ValueError: If the cached document is not a JSON object
+        """
         if self.cache_path.exists():
-            with open(self.cache_path, 'r') as f:
-                return json.load(f)
+            with open(self.cache_path, 'rb') as f:
+                events = ijson.parse(f, use_float=True)
+                first = next(events)
+                if first[1] != 'start_map':
+                    raise ValueError(
+                        f"Expected a JSON object at the root of {self.cache_path}, got {first[1]}"
+                    )
+                yield from ijson.kvitems(itertools.chain([first], events), '')
+            return
+
+        yield from self._load_data().items()
 
-        # Try URL if no cache and URL is configured
+    def _load_data(self) -> Dict[str, Any]:
+        """Download data.json from the configured URL and cache it."""
         if self.url:
             response = requests.get(self.url, timeout=30)
             response.raise_for_status()
@@ -131,7 +150,7 @@ class EchoDataAdapter(BaseAdapter):
             source_id=self.source_id,
             cve_id=cve_id,
             package_name=package_name,
-            observed_at=datetime.utcnow(),
+            observed_at=self._last_fetch or datetime.utcnow(),
             source_updated_at=None,  # data.json doesn't have per-record timestamps
             raw_payload=raw_record if isinstance(raw_record, dict) else {},
             status=status,
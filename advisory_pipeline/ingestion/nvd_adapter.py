@@ -134,7 +134,7 @@ class NvdAdapter(BaseAdapter):
             source_id=self.source_id,
             cve_id=cve_id,
             package_name=None,  # NVD doesn't have package-level granularity
-            observed_at=datetime.utcnow(),
+            observed_at=self._last_fetch or datetime.utcnow(),
             source_updated_at=source_updated_at,
             raw_payload=raw_record,
             rejection_status=rejection_status,
@@ -149,13 +149,17 @@ class NvdAdapter(BaseAdapter):
             logger.warning("NVD validation failure (%s): %s", reason, str(payload)[:500])
         self._validation_failures += 1
 
+    def _load_mock(self) -> Dict[str, Any]:
+        """Read and parse the mock response file."""
+        with open(self.mock_file, "r") as handle:
+            return json.load(handle)
+
     def _fetch_mock(self) -> List[SourceObservation]:
         if not self.mock_file.exists():
             self._records_fetched = 0
             return []
 
-        with open(self.mock_file, "r") as handle:
-            data = json.load(handle)
+        data = self._load_mock()
 
         observations: List[SourceObservation] = []
         for vuln in data.get("vulnerabilities", []):
@@ -147,7 +147,7 @@ class OsvAdapter(BaseAdapter):
             source_id=self.source_id,
             cve_id=cve_id,
             package_name=package_name,
-            observed_at=datetime.utcnow(),
+            observed_at=self._last_fetch or datetime.utcnow(),
             source_updated_at=source_updated_at,
             raw_payload={"vuln": raw_record, "affected": affected},
             fix_available=fix_available,
@@ -162,13 +162,17 @@ class OsvAdapter(BaseAdapter):
             logger.warning("OSV validation failure (%s): %s", reason, str(payload)[:500])
         self._validation_failures += 1
 
+    def _load_mock(self) -> Dict[str, Any]:
+        """Read and parse the mock response file."""
+        with open(self.mock_file, "r") as handle:
+            return json.load(handle)
+
     def _fetch_mock(self) -> List[SourceObservation]:
         if not self.mock_file.exists():
             self._records_fetched = 0
             return []
 
-        with open(self.mock_file, "r") as handle:
-            data = json.load(handle)
+        data = self._load_mock()
 
         observations: List[SourceObservation] = []
         for vuln in data.get("vulns", []):
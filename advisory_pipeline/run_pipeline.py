@@ -127,8 +127,9 @@ class AdvisoryPipeline:
         Raises:
             RuntimeError: If critical stage fails
         """
-        run_id = self.db.get_current_run_id()
-        metrics = RunMetrics(run_id=run_id, started_at=datetime.utcnow())
+        started_at = datetime.utcnow()
+        run_id = self.db.get_current_run_id(started_at)
+        metrics = RunMetrics(run_id=run_id, started_at=started_at)
 
         logger.info(f"=== Starting Pipeline Run: {run_id} ===")
 
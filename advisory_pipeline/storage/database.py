@@ -9,15 +9,160 @@ This module provides:
 
 Design decisions:
 - Using DuckDB instead of SQLite for better dbt compatibility
-- JSON columns for storing raw payloads and complex evidence
+- JSON columns for storing raw payloads; source lists, evidence and
+  references are JSON text in VARCHAR columns (no validating parse on
+  insert, still readable with json_extract)
 - SCD Type 2 pattern with effective_from/effective_to timestamps
-- Indexed on advisory_id, cve_id, and is_current for query performance
+- Indexed on advisory_id and cve_id for query performance, plus an
+  (advisory_id, effective_from, effective_to) composite for point-in-time
+  lookups. is_current is left to DuckDB's columnar scan, since a boolean
+  index is not selective.
 """
 import duckdb
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Full schema DDL, run as one multi-statement script by initialize_schema
+_SCHEMA_SQL = """
+-- Raw Echo advisories (from data.json)
+CREATE TABLE IF NOT EXISTS raw_echo_advisories (
+    observation_id VARCHAR PRIMARY KEY,
+    cve_id VARCHAR,
+    package_name VARCHAR,
+    observed_at TIMESTAMP,
+    raw_payload JSON,
+    status VARCHAR,
+    fix_available BOOLEAN,
+    fixed_version VARCHAR,
+    cvss_score DOUBLE,
+    notes VARCHAR,
+    run_id VARCHAR
+);
+
+-- Raw Echo CSV overrides
+CREATE TABLE IF NOT EXISTS raw_echo_csv (
+    observation_id VARCHAR PRIMARY KEY,
+    cve_id VARCHAR,
+    package_name VARCHAR,
+    observed_at TIMESTAMP,
+    source_updated_at TIMESTAMP,
+    raw_payload JSON,
+    status VARCHAR,
+    reason VARCHAR,
+    run_id VARCHAR
+);
+
+-- Raw NVD observations
+CREATE TABLE IF NOT EXISTS raw_nvd_observations (
+    observation_id VARCHAR PRIMARY KEY,
+    cve_id VARCHAR,
+    observed_at TIMESTAMP,
+    raw_payload JSON,
+    rejection_status VARCHAR,
+    cvss_score DOUBLE,
+    cvss_vector VARCHAR,
+    "references" VARCHAR,
+    notes VARCHAR,
+    run_id VARCHAR
+);
+
+-- Raw OSV observations
+CREATE TABLE IF NOT EXISTS raw_osv_observations (
+    observation_id VARCHAR PRIMARY KEY,
+    cve_id VARCHAR,
+    package_name VARCHAR,
+    observed_at TIMESTAMP,
+    raw_payload JSON,
+    fix_available BOOLEAN,
+    fixed_version VARCHAR,
+    "references" VARCHAR,
+    notes VARCHAR,
+    run_id VARCHAR
+);
+
+-- All raw observations in one relation, so cross-source lookups
+-- are a single query (source_id values match the dbt models)
+CREATE OR REPLACE VIEW all_raw_observations AS
+SELECT observation_id, 'echo_data' AS source_id, cve_id, package_name, observed_at, run_id
+FROM raw_echo_advisories
+UNION ALL
+SELECT observation_id, 'echo_csv' AS source_id, cve_id, package_name, observed_at, run_id
+FROM raw_echo_csv
+UNION ALL
+SELECT observation_id, 'nvd' AS source_id, cve_id, NULL AS package_name, observed_at, run_id
+FROM raw_nvd_observations
+UNION ALL
+SELECT observation_id, 'osv' AS source_id, cve_id, package_name, observed_at, run_id
+FROM raw_osv_observations;
+
+-- Pipeline run metadata
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    run_id VARCHAR PRIMARY KEY,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    status VARCHAR,
+    advisories_processed INTEGER,
+    state_changes INTEGER,
+    errors INTEGER,
+    metadata JSON
+);
+
+-- Advisory state history (SCD Type 2)
+-- This table is populated by dbt snapshots in Phase 4, not Python
+-- Schema matches dbt snapshot requirements for temporal tracking
+CREATE TABLE IF NOT EXISTS advisory_state_history (
+    history_id VARCHAR PRIMARY KEY,
+    advisory_id VARCHAR NOT NULL,
+    cve_id VARCHAR,
+    package_name VARCHAR,
+    state VARCHAR NOT NULL,
+    state_type VARCHAR,
+    fixed_version VARCHAR,
+    confidence VARCHAR,
+    explanation VARCHAR,
+    reason_code VARCHAR,
+    evidence VARCHAR,
+    decision_rule VARCHAR,
+    contributing_sources VARCHAR,
+    dissenting_sources VARCHAR,
+    effective_from TIMESTAMP NOT NULL,
+    effective_to TIMESTAMP,
+    is_current BOOLEAN NOT NULL,
+    run_id VARCHAR,
+    staleness_score DOUBLE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for query performance
+CREATE INDEX IF NOT EXISTS idx_ash_advisory
+ON advisory_state_history(advisory_id);
+
+-- Boolean index on is_current was dropped: it is not selective and
+-- only added maintenance cost to every history write
+DROP INDEX IF EXISTS idx_ash_current;
+
+CREATE INDEX IF NOT EXISTS idx_ash_cve
+ON advisory_state_history(cve_id);
+
+-- Point-in-time lookups filter on advisory_id first, then the
+-- effective range; this replaces the old idx_ash_effective
+DROP INDEX IF EXISTS idx_ash_effective;
+CREATE INDEX IF NOT EXISTS idx_ash_pit
+ON advisory_state_history(advisory_id, effective_from, effective_to);
+"""
+
+# Tables and views that initialize_schema creates, checked by verify_schema
+_SCHEMA_RELATIONS = (
+    "raw_echo_advisories",
+    "raw_echo_csv",
+    "raw_nvd_observations",
+    "raw_osv_observations",
+    "all_raw_observations",
+    "pipeline_runs",
+    "advisory_state_history",
+)
+
 
 class Database:
     """
@@ -35,7 +180,8 @@ class Database:
         Initialize database manager.
 
         Args:
-            db_path: Path to DuckDB database file (created if doesn't exist)
+            db_path: Path to DuckDB database file (created if doesn't exist),
+                     or ":memory:" for a private in-memory database
         """
         self.db_path = db_path
         self.conn: Optional[duckdb.DuckDBPyConnection] = None
@@ -66,137 +212,12 @@ class Database:
         - raw_echo_csv: Internal analyst overrides
         - raw_nvd_observations: NVD CVE data
         - raw_osv_observations: OSV vulnerability data
+        - all_raw_observations: View over the four raw tables, tagged by source_id
         - advisory_state_history: SCD2 state tracking
         - pipeline_runs: Pipeline execution metadata
         """
         conn = self.connect()
-
-        # Raw Echo advisories (from data.json)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS raw_echo_advisories (
-                observation_id VARCHAR PRIMARY KEY,
-                cve_id VARCHAR,
-                package_name VARCHAR,
-                observed_at TIMESTAMP,
-                raw_payload JSON,
-                status VARCHAR,
-                fix_available BOOLEAN,
-                fixed_version VARCHAR,
-                cvss_score DOUBLE,
-                notes VARCHAR,
-                run_id VARCHAR
-            )
-        """)
-
-        # Raw Echo CSV overrides
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS raw_echo_csv (
-                observation_id VARCHAR PRIMARY KEY,
-                cve_id VARCHAR,
-                package_name VARCHAR,
-                observed_at TIMESTAMP,
-                source_updated_at TIMESTAMP,
-                raw_payload JSON,
-                status VARCHAR,
-                reason VARCHAR,
-                run_id VARCHAR
-            )
-        """)
-
-        # Raw NVD observations
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS raw_nvd_observations (
-                observation_id VARCHAR PRIMARY KEY,
-                cve_id VARCHAR,
-                observed_at TIMESTAMP,
-                raw_payload JSON,
-                rejection_status VARCHAR,
-                cvss_score DOUBLE,
-                cvss_vector VARCHAR,
-                "references" JSON,
-                notes VARCHAR,
-                run_id VARCHAR
-            )
-        """)
-
-        # Raw OSV observations
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS raw_osv_observations (
-                observation_id VARCHAR PRIMARY KEY,
-                cve_id VARCHAR,
-                package_name VARCHAR,
-                observed_at TIMESTAMP,
-                raw_payload JSON,
-                fix_available BOOLEAN,
-                fixed_version VARCHAR,
-                "references" JSON,
-                notes VARCHAR,
-                run_id VARCHAR
-            )
-        """)
-
-        # Pipeline run metadata
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS pipeline_runs (
-                run_id VARCHAR PRIMARY KEY,
-                started_at TIMESTAMP,
-                completed_at TIMESTAMP,
-                status VARCHAR,
-                advisories_processed INTEGER,
-                state_changes INTEGER,
-                errors INTEGER,
-                metadata JSON
-            )
-        """)
-
-        # Advisory state history (SCD Type 2)
-        # This table is populated by dbt snapshots in Phase 4, not Python
-        # Schema matches dbt snapshot requirements for temporal tracking
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS advisory_state_history (
-                history_id VARCHAR PRIMARY KEY,
-                advisory_id VARCHAR NOT NULL,
-                cve_id VARCHAR,
-                package_name VARCHAR,
-                state VARCHAR NOT NULL,
-                state_type VARCHAR,
-                fixed_version VARCHAR,
-                confidence VARCHAR,
-                explanation VARCHAR,
-                reason_code VARCHAR,
-                evidence JSON,
-                decision_rule VARCHAR,
-                contributing_sources JSON,
-                dissenting_sources JSON,
-                effective_from TIMESTAMP NOT NULL,
-                effective_to TIMESTAMP,
-                is_current BOOLEAN NOT NULL,
-                run_id VARCHAR,
-                staleness_score DOUBLE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for query performance
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ash_advisory
-            ON advisory_state_history(advisory_id)
-        """)
-
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ash_current
-            ON advisory_state_history(is_current)
-        """)
-
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ash_cve
-            ON advisory_state_history(cve_id)
-        """)
-
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ash_effective
-            ON advisory_state_history(effective_from, effective_to)
-        """)
+        conn.execute(_SCHEMA_SQL)
 
         self._ensure_columns(
             "raw_echo_advisories",
@@ -206,14 +227,33 @@ class Database:
             },
         )
 
-    def get_current_run_id(self) -> str:
+    def verify_schema(self) -> bool:
+        """
+        Check that every table and view from initialize_schema exists.
+
+        Returns:
+            True if all schema relations are present, False otherwise
+        """
+        placeholders = ", ".join("?" for _ in _SCHEMA_RELATIONS)
+        (found,) = self.connect().execute(f"""
+            SELECT COUNT(*) FROM information_schema.tables
+            WHERE table_schema = 'main' AND table_name IN ({placeholders})
+        """, list(_SCHEMA_RELATIONS)).fetchone()
+        return found == len(_SCHEMA_RELATIONS)
+
+    def get_current_run_id(self, started_at: Optional[datetime] = None) -> str:
         """
         Generate a unique run ID for this pipeline execution.
 
+        Args:
+            started_at: Run start timestamp to encode (defaults to now)
+
         Returns:
             Run ID in format: run_YYYYMMDD_HHMMSS
         """
-        return f"run_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        if started_at is None:
+            started_at = datetime.utcnow()
+        return f"run_{started_at.strftime('%Y%m%d_%H%M%S')}"
 
     def __enter__(self):
         """Context manager entry."""
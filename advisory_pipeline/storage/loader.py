@@ -9,15 +9,166 @@ Design decisions:
 - Per-source loader methods for explicit field mapping
 - DELETE + INSERT pattern for idempotent loads
 - JSON serialization for complex fields (raw_payload, references)
-- Batch-friendly design (though currently single-record inserts)
+- Set-based inserts: rows are built up front, encoded as one in-memory
+  JSON document and written with one INSERT ... SELECT over
+  json_transform_strict per table, avoiding per-row parameter binding
+- Compact JSON encoding; orjson is used when installed, with the
+  standard library as fallback
+- load_all writes all four raw tables in one transaction, so a run's
+  landing zone is replaced atomically with a single commit
 """
 import json
-from typing import List
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import duckdb
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
 
 from ingestion.base_adapter import SourceObservation
 from .database import Database
 
 
+# Column name -> DuckDB type for each raw table, in the order the matching
+# loader builds its row tuples; JSON columns take the Python object itself
+_ECHO_ADVISORY_COLUMNS = {
+    "observation_id": "VARCHAR",
+    "cve_id": "VARCHAR",
+    "package_name": "VARCHAR",
+    "observed_at": "TIMESTAMP",
+    "raw_payload": "JSON",
+    "status": "VARCHAR",
+    "fix_available": "BOOLEAN",
+    "fixed_version": "VARCHAR",
+    "cvss_score": "DOUBLE",
+    "notes": "VARCHAR",
+    "run_id": "VARCHAR",
+}
+
+_ECHO_CSV_COLUMNS = {
+    "observation_id": "VARCHAR",
+    "cve_id": "VARCHAR",
+    "package_name": "VARCHAR",
+    "observed_at": "TIMESTAMP",
+    "source_updated_at": "TIMESTAMP",
+    "raw_payload": "JSON",
+    "status": "VARCHAR",
+    "reason": "VARCHAR",
+    "run_id": "VARCHAR",
+}
+
+_NVD_OBSERVATION_COLUMNS = {
+    "observation_id": "VARCHAR",
+    "cve_id": "VARCHAR",
+    "observed_at": "TIMESTAMP",
+    "raw_payload": "JSON",
+    "rejection_status": "VARCHAR",
+    "cvss_score": "DOUBLE",
+    "cvss_vector": "VARCHAR",
+    "references": "JSON",
+    "notes": "VARCHAR",
+    "run_id": "VARCHAR",
+}
+
+_OSV_OBSERVATION_COLUMNS = {
+    "observation_id": "VARCHAR",
+    "cve_id": "VARCHAR",
+    "package_name": "VARCHAR",
+    "observed_at": "TIMESTAMP",
+    "raw_payload": "JSON",
+    "fix_available": "BOOLEAN",
+    "fixed_version": "VARCHAR",
+    "references": "JSON",
+    "notes": "VARCHAR",
+    "run_id": "VARCHAR",
+}
+
+
+def _json_default(value: Any) -> str:
+    """Serialize timestamps for staging; aware values are stored as naive UTC."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(sep=" ")
+    raise TypeError(f"Cannot stage value of type {type(value).__name__}")
+
+
+def _finite(value: Any) -> Any:
+    """Return value with NaN and infinite floats replaced by None, recursively."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Encode value as compact UTF-8 JSON, via orjson when it is available.
+
+    Both encoders write NaN and infinite floats as null: orjson does so
+    natively, and the standard library path retries with those values
+    replaced, since its NaN/Infinity tokens are not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the standard library handle it
+            pass
+    try:
+        text = json.dumps(
+            value, default=_json_default, separators=(",", ":"),
+            ensure_ascii=False, allow_nan=False
+        )
+    except ValueError:
+        text = json.dumps(
+            _finite(value), default=_json_default, separators=(",", ":"),
+            ensure_ascii=False, allow_nan=False
+        )
+    return text.encode("utf-8")
+
+
+def _bulk_insert(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: Dict[str, str],
+    rows: List[tuple]
+) -> None:
+    """
+    Insert rows into table with a single set-based statement.
+
+    Rows are encoded as one JSON array and bound as a single parameter;
+    json_transform_strict turns it into typed rows inside DuckDB. Nothing
+    touches the filesystem, no Python parameters are bound per row, and
+    JSON columns are encoded once, as nested values of the array.
+    """
+    if not rows:
+        return
+
+    names = list(columns)
+    document = _dumps([dict(zip(names, row)) for row in rows]).decode("utf-8")
+    structure = json.dumps([columns])
+
+    column_list = ", ".join(f'"{name}"' for name in names)
+    conn.execute(
+        f"INSERT INTO {table} ({column_list}) "
+        f"SELECT staged.* FROM ("
+        f"SELECT unnest(json_transform_strict(?::JSON, ?)) AS staged)",
+        [document, structure]
+    )
+
+
 class SourceLoader:
     """
     Loads observations from adapters into raw landing zone tables.
@@ -26,7 +177,7 @@ class SourceLoader:
     1. Clears previous data for this run_id
     2. Maps SourceObservation fields to table columns
     3. Handles JSON serialization for complex types
-    4. Inserts records into the appropriate raw table
+    4. Inserts records into the appropriate raw table in one batch
     """
 
     def __init__(self, database: Database):
@@ -38,155 +189,204 @@ class SourceLoader:
         """
         self.db = database
 
-    def load_echo_advisories(self, observations: List[SourceObservation], run_id: str) -> int:
+    def load_echo_advisories(
+        self,
+        observations: List[SourceObservation],
+        run_id: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> int:
         """
         Load Echo advisory observations from data.json.
 
         Args:
             observations: List of normalized observations from EchoDataAdapter
             run_id: Pipeline run identifier
+            conn: Connection or cursor to write with (defaults to the database connection)
 
         Returns:
             Number of records loaded
         """
-        conn = self.db.connect()
-
-        # Clear all previous data (truncate and reload pattern for idempotency)
-        conn.execute("DELETE FROM raw_echo_advisories")
-
-        loaded = 0
-        for obs in observations:
-            conn.execute("""
-                INSERT INTO raw_echo_advisories
-                (observation_id, cve_id, package_name, observed_at, raw_payload,
-                 status, fix_available, fixed_version, cvss_score, notes, run_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        rows = [
+            (
                 obs.observation_id,
                 obs.cve_id,
                 obs.package_name,
                 obs.observed_at,
-                json.dumps(obs.raw_payload),
+                obs.raw_payload,
                 obs.status,
                 obs.fix_available,
                 obs.fixed_version,
                 obs.cvss_score,
-                obs.notes,
-                run_id
-            ])
-            loaded += 1
+                obs.notes
+            )
+            for obs in observations
+        ]
+        return self.load_echo_advisories_rows(rows, run_id, conn=conn)
 
-        return loaded
+    def load_echo_advisories_rows(
+        self,
+        rows: Iterable[tuple],
+        run_id: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> int:
+        """
+        Load pre-built Echo advisory rows, skipping SourceObservation construction.
 
-    def load_echo_csv(self, observations: List[SourceObservation], run_id: str) -> int:
+        Each row holds the raw_echo_advisories columns in table order, without
+        run_id: (observation_id, cve_id, package_name, observed_at,
+        raw_payload, status, fix_available, fixed_version, cvss_score, notes),
+        where raw_payload is the payload object (e.g. a dict), not JSON text.
+
+        Args:
+            rows: Row tuples in the layout above
+            run_id: Pipeline run identifier
+            conn: Connection or cursor to write with (defaults to the database connection)
+
+        Returns:
+            Number of records loaded
+
+        Raises:
+            ValueError: If a row does not have exactly the 10 columns above
+        """
+        width = len(_ECHO_ADVISORY_COLUMNS) - 1  # run_id is appended here
+        rows = [tuple(row) for row in rows]
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(
+                    f"Echo advisory row has {len(row)} columns, expected {width} "
+                    "(observation_id, cve_id, package_name, observed_at, raw_payload, "
+                    "status, fix_available, fixed_version, cvss_score, notes)"
+                )
+
+        if conn is None:
+            conn = self.db.connect()
+
+        # Clear all previous data (truncate and reload pattern for idempotency)
+        conn.execute("DELETE FROM raw_echo_advisories")
+
+        rows = [row + (run_id,) for row in rows]
+        _bulk_insert(conn, "raw_echo_advisories", _ECHO_ADVISORY_COLUMNS, rows)
+
+        return len(rows)
+
+    def load_echo_csv(
+        self,
+        observations: List[SourceObservation],
+        run_id: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> int:
         """
         Load Echo CSV override observations.
 
         Args:
             observations: List of normalized observations from EchoCsvAdapter
             run_id: Pipeline run identifier
+            conn: Connection or cursor to write with (defaults to the database connection)
 
         Returns:
             Number of records loaded
         """
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         conn.execute("DELETE FROM raw_echo_csv")
 
-        loaded = 0
-        for obs in observations:
-            conn.execute("""
-                INSERT INTO raw_echo_csv
-                (observation_id, cve_id, package_name, observed_at, source_updated_at,
-                 raw_payload, status, reason, run_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        rows = [
+            (
                 obs.observation_id,
                 obs.cve_id,
                 obs.package_name,
                 obs.observed_at,
                 obs.source_updated_at,
-                json.dumps(obs.raw_payload),
+                obs.raw_payload,
                 obs.status,
                 obs.notes,  # CSV adapter stores reason in notes field
                 run_id
-            ])
-            loaded += 1
+            )
+            for obs in observations
+        ]
+        _bulk_insert(conn, "raw_echo_csv", _ECHO_CSV_COLUMNS, rows)
 
-        return loaded
+        return len(rows)
 
-    def load_nvd_observations(self, observations: List[SourceObservation], run_id: str) -> int:
+    def load_nvd_observations(
+        self,
+        observations: List[SourceObservation],
+        run_id: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> int:
         """
         Load NVD CVE observations.
 
         Args:
             observations: List of normalized observations from NvdAdapter
             run_id: Pipeline run identifier
+            conn: Connection or cursor to write with (defaults to the database connection)
 
         Returns:
             Number of records loaded
         """
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         conn.execute("DELETE FROM raw_nvd_observations")
 
-        loaded = 0
-        for obs in observations:
-            conn.execute("""
-                INSERT INTO raw_nvd_observations
-                (observation_id, cve_id, observed_at, raw_payload, rejection_status,
-                 cvss_score, cvss_vector, "references", notes, run_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        rows = [
+            (
                 obs.observation_id,
                 obs.cve_id,
                 obs.observed_at,
-                json.dumps(obs.raw_payload),
+                obs.raw_payload,
                 obs.rejection_status,
                 obs.cvss_score,
                 obs.cvss_vector,
-                json.dumps(obs.references) if obs.references else None,
+                obs.references or None,
                 obs.notes,
                 run_id
-            ])
-            loaded += 1
+            )
+            for obs in observations
+        ]
+        _bulk_insert(conn, "raw_nvd_observations", _NVD_OBSERVATION_COLUMNS, rows)
 
-        return loaded
+        return len(rows)
 
-    def load_osv_observations(self, observations: List[SourceObservation], run_id: str) -> int:
+    def load_osv_observations(
+        self,
+        observations: List[SourceObservation],
+        run_id: str,
+        conn: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> int:
         """
         Load OSV vulnerability observations.
 
         Args:
             observations: List of normalized observations from OsvAdapter
             run_id: Pipeline run identifier
+            conn: Connection or cursor to write with (defaults to the database connection)
 
         Returns:
             Number of records loaded
         """
-        conn = self.db.connect()
+        if conn is None:
+            conn = self.db.connect()
         conn.execute("DELETE FROM raw_osv_observations")
 
-        loaded = 0
-        for obs in observations:
-            conn.execute("""
-                INSERT INTO raw_osv_observations
-                (observation_id, cve_id, package_name, observed_at, raw_payload,
-                 fix_available, fixed_version, "references", notes, run_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        rows = [
+            (
                 obs.observation_id,
                 obs.cve_id,
                 obs.package_name,
                 obs.observed_at,
-                json.dumps(obs.raw_payload),
+                obs.raw_payload,
                 obs.fix_available,
                 obs.fixed_version,
-                json.dumps(obs.references) if obs.references else None,
+                obs.references or None,
                 obs.notes,
                 run_id
-            ])
-            loaded += 1
+            )
+            for obs in observations
+        ]
+        _bulk_insert(conn, "raw_osv_observations", _OSV_OBSERVATION_COLUMNS, rows)
 
-        return loaded
+        return len(rows)
 
     def load_all(
         self,
@@ -209,9 +409,17 @@ class SourceLoader:
         Returns:
             Dictionary with counts per source
         """
-        return {
-            "echo_advisories": self.load_echo_advisories(echo_advisories, run_id),
-            "echo_csv": self.load_echo_csv(echo_csv, run_id),
-            "nvd": self.load_nvd_observations(nvd, run_id),
-            "osv": self.load_osv_observations(osv, run_id)
-        }
+        conn = self.db.connect()
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            counts = {
+                "echo_advisories": self.load_echo_advisories(echo_advisories, run_id, conn=conn),
+                "echo_csv": self.load_echo_csv(echo_csv, run_id, conn=conn),
+                "nvd": self.load_nvd_observations(nvd, run_id, conn=conn),
+                "osv": self.load_osv_observations(osv, run_id, conn=conn),
+            }
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return counts
@@ -0,0 +1,61 @@
+"""
+Typed builders and shared constants for advisory test data.
+
+Tests describe an enriched advisory with keyword arguments instead of
+hand-written dict literals; as_dict() produces the mapping the rule
+engine consumes.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+
+class _Unset:
+    """Marker for builder fields the test did not set."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'UNSET'
+
+
+UNSET: Any = _Unset()
+
+# Fixed timestamp for test data; no assertion depends on wall-clock time
+NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class Advisory:
+    """
+    Enriched advisory signals as seen by the rule engine.
+
+    Fields left at UNSET are omitted from as_dict(), matching a dict
+    literal that never set the key (rules read every signal with .get).
+    An explicit None is kept, so tests can send null signals.
+    """
+    advisory_id: str = ''
+    cve_id: Optional[str] = UNSET
+    package_name: Optional[str] = UNSET
+    override_status: Optional[str] = UNSET
+    override_reason: Optional[str] = UNSET
+    csv_updated_at: Optional[str] = UNSET
+    is_rejected: Optional[bool] = UNSET
+    nvd_rejection_status: Optional[str] = UNSET
+    fix_available: Optional[bool] = UNSET
+    fixed_version: Optional[str] = UNSET
+    has_signal: Optional[bool] = UNSET
+    contributing_sources: Optional[Sequence[str]] = UNSET
+    source_count: Optional[int] = UNSET
+    cvss_score: Optional[float] = UNSET
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Build a fresh advisory_data dict from the fields that are set."""
+        data = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not UNSET:
+                data[field.name] = value
+        if data.get('contributing_sources') is not None:
+            data['contributing_sources'] = list(data['contributing_sources'])
+        return data
@@ -0,0 +1,25 @@
+"""
+Process-wide cache of parsed adapter mock response files.
+
+Mock response files never change during a test session, so each one is
+read and parsed once. Callers share the parsed object and must treat it
+as read-only; the NVD and OSV adapters only read their mock data.
+"""
+import functools
+import json
+from typing import Any, Dict
+
+
+@functools.lru_cache(maxsize=None)
+def load_mock(path: str) -> Dict[str, Any]:
+    """
+    Read and parse a mock response file once, caching the result by path.
+
+    Args:
+        path: Path to the mock JSON file
+
+    Returns:
+        Parsed JSON payload, shared by every caller; do not mutate it
+    """
+    with open(path, "r") as handle:
+        return json.load(handle)
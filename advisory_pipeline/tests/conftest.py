@@ -4,37 +4,108 @@ Shared pytest fixtures for advisory pipeline tests.
 This module provides reusable fixtures that simplify test setup
 and reduce code duplication across test modules.
 """
-import tempfile
-from datetime import datetime
-from pathlib import Path
+import os
+import sys
 
 import pytest
 
+# Make the pipeline packages importable for every test module
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from decisioning import DecisionExplainer, RuleEngine
 from storage import Database, SourceLoader
 from ingestion.base_adapter import SourceObservation
+from _fixtures import NOW
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_db():
     """
-    Create a temporary in-memory database for testing.
+    Create an in-memory database shared by the whole test session.
+
+    The schema is built once; _reset_temp_db empties every table after
+    each test that uses it, so tests still start from an empty database.
+    No test needs persistence, so nothing is written to disk, and each
+    pytest-xdist worker process gets its own database.
 
     Yields:
         Database instance with schema initialized
 
     Cleanup:
-        Automatically closes connection and removes file after test
+        Automatically closes connection
     """
-    with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=True) as f:
-        db_path = f.name
-
-    db = Database(db_path)
+    db = Database(":memory:")
     db.initialize_schema()
     yield db
     db.close()
 
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
+
+@pytest.fixture(autouse=True)
+def _reset_temp_db(request):
+    """Delete all rows from the shared database after tests that use it."""
+    if "temp_db" not in request.fixturenames:
+        yield
+        return
+
+    db = request.getfixturevalue("temp_db")
+    yield
+
+    conn = db.connect()
+    tables = conn.execute("""
+        SELECT table_name FROM information_schema.tables
+        WHERE table_schema = 'main' AND table_type = 'BASE TABLE'
+    """).fetchall()
+    for (table,) in tables:
+        conn.execute(f'DELETE FROM "{table}"')
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """
+    Shared RuleEngine for a test module.
+
+    Rules hold no state between decide() calls, so one engine can
+    serve every test in the module.
+
+    Returns:
+        RuleEngine with the default rule chain
+    """
+    return RuleEngine()
+
+
+@pytest.fixture(scope="module")
+def explainer():
+    """
+    Shared DecisionExplainer with the default templates.
+
+    Returns:
+        DecisionExplainer instance reused across a test module
+    """
+    return DecisionExplainer()
+
+
+@pytest.fixture(scope="session")
+def echo_csv_path():
+    """
+    Absolute path to the analyst override CSV, independent of the cwd.
+
+    Returns:
+        Path string suitable for EchoCsvAdapter's "path" config
+    """
+    return os.path.join(os.path.dirname(_ROOT), "data", "advisory-not-applicable.csv")
+
+
+@pytest.fixture(scope="session")
+def echo_csv_bytes(echo_csv_path):
+    """
+    Contents of the analyst override CSV, read once per session.
+
+    Returns:
+        Raw bytes suitable for EchoCsvAdapter's "content" config
+    """
+    with open(echo_csv_path, "rb") as f:
+        return f.read()
 
 
 @pytest.fixture
@@ -51,7 +122,7 @@ def sample_echo_observations():
             source_id="echo_data",
             cve_id="CVE-2024-0001",
             package_name="example-package",
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"test": "data"},
             status="open",
             cvss_score=7.5,
@@ -62,7 +133,7 @@ def sample_echo_observations():
             source_id="echo_data",
             cve_id="CVE-2024-0002",
             package_name="db-handler",
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"test": "data"},
             status="open",
             cvss_score=9.8,
@@ -85,7 +156,7 @@ def sample_nvd_observations():
             source_id="nvd",
             cve_id="CVE-2024-0001",
             package_name=None,
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"cve": {"id": "CVE-2024-0001"}},
             rejection_status="none",
             cvss_score=7.5,
@@ -97,7 +168,7 @@ def sample_nvd_observations():
             source_id="nvd",
             cve_id="CVE-2024-0002",
             package_name=None,
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"cve": {"id": "CVE-2024-0002"}},
             rejection_status="rejected",
             cvss_score=None,
@@ -121,7 +192,7 @@ def sample_osv_observations():
             source_id="osv",
             cve_id="CVE-2024-0001",
             package_name="example-package",
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"id": "GHSA-0001-0001-0001"},
             fix_available=True,
             fixed_version="1.2.3",
@@ -145,8 +216,8 @@ def sample_csv_observations():
             source_id="echo_csv",
             cve_id="CVE-2024-0003",
             package_name="parser-lib",
-            observed_at=datetime.utcnow(),
-            source_updated_at=datetime.utcnow(),
+            observed_at=NOW,
+            source_updated_at=NOW,
             raw_payload={"analyst": "john.doe"},
             status="not_applicable",
             notes="Not applicable - service not exposed"
@@ -154,10 +225,10 @@ def sample_csv_observations():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def loader(temp_db):
     """
-    Create a SourceLoader instance for testing.
+    Create a SourceLoader instance shared across the session.
 
     Args:
         temp_db: Temporary database fixture
@@ -166,3 +237,20 @@ def loader(temp_db):
         SourceLoader instance connected to temp database
     """
     return SourceLoader(temp_db)
+
+
+@pytest.fixture
+def ro_conn(temp_db):
+    """
+    Separate cursor for assertion queries, kept off the loader's connection.
+
+    The cursor shares temp_db's in-memory database, so it sees everything
+    the loader has committed. Tests only read through it, although it is
+    not opened read-only.
+
+    Yields:
+        DuckDB cursor on the session's in-memory database
+    """
+    cursor = temp_db.connect().cursor()
+    yield cursor
+    cursor.close()
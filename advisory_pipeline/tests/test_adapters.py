@@ -3,13 +3,17 @@ Basic validation tests for ingestion adapters.
 
 Tests basic functionality and data loading for all adapters.
 """
+import logging
 import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if __name__ == "__main__":
+    # Script mode: conftest.py is not loaded, so add the package root here
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
 
+from _mock_cache import load_mock
 from ingestion import (
     EchoCsvAdapter,
     EchoDataAdapter,
@@ -17,6 +21,24 @@ from ingestion import (
     OsvAdapter,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def cached_mock_responses(monkeypatch):
+    """
+    Serve NVD/OSV mock responses from the session-wide parse cache.
+
+    Adapters in mock mode otherwise read and parse their mock file on
+    every fetch(). Tests that do not request this fixture exercise the
+    adapters' own _load_mock.
+    """
+    def _cached(adapter):
+        return load_mock(str(adapter.mock_file))
+
+    monkeypatch.setattr(NvdAdapter, "_load_mock", _cached)
+    monkeypatch.setattr(OsvAdapter, "_load_mock", _cached)
+
 
 def test_echo_data_adapter():
     """Test Echo data.json adapter can load and normalize data."""
@@ -45,7 +67,20 @@ def test_echo_data_adapter():
     assert obs.package_name is not None
     assert obs.observation_id is not None
 
-    print(f"✓ EchoDataAdapter: Loaded {len(observations)} observations")
+    logger.debug("✓ EchoDataAdapter: Loaded %d observations", len(observations))
+
+
+def test_echo_data_adapter_rejects_non_object_root(tmp_path):
+    """Test a data.json whose root is not an object is reported as an error."""
+    cache_path = tmp_path / "data.json"
+    cache_path.write_text('[{"CVE-2024-0001": {}}]')
+    adapter = EchoDataAdapter({"cache_path": str(cache_path), "url": None})
+
+    assert adapter.fetch() == []
+
+    health = adapter.get_health()
+    assert not health.is_healthy
+    assert "Expected a JSON object" in health.error_message
 
 
 def test_echo_csv_adapter():
@@ -73,9 +108,22 @@ def test_echo_csv_adapter():
     assert obs.package_name is not None
     assert obs.status is not None
 
-    print(f"✓ EchoCsvAdapter: Loaded {len(observations)} observations")
+    logger.debug("✓ EchoCsvAdapter: Loaded %d observations", len(observations))
+
+
+def test_echo_csv_adapter_from_bytes(echo_csv_bytes, echo_csv_path):
+    """Test Echo CSV adapter parses preloaded bytes like the file on disk."""
+    from_bytes = EchoCsvAdapter({"content": echo_csv_bytes}).fetch()
+    from_file = EchoCsvAdapter({"path": echo_csv_path}).fetch()
+
+    assert len(from_bytes) > 0, "Should parse observations from CSV bytes"
+    assert [o.observation_id for o in from_bytes] == [o.observation_id for o in from_file]
+    assert [o.raw_payload for o in from_bytes] == [o.raw_payload for o in from_file]
+    # One fetch stamps every observation with the same fetch time
+    assert {o.observed_at for o in from_bytes} == {from_bytes[0].observed_at}
 
 
+@pytest.mark.usefixtures("cached_mock_responses")
 def test_nvd_adapter():
     """Test NVD adapter can load and normalize mock responses."""
     config = {
@@ -101,9 +149,10 @@ def test_nvd_adapter():
     assert obs.cve_id is not None
     assert obs.cvss_score is not None or obs.rejection_status == "rejected"
 
-    print(f"✓ NvdAdapter: Loaded {len(observations)} observations")
+    logger.debug("✓ NvdAdapter: Loaded %d observations", len(observations))
 
 
+@pytest.mark.usefixtures("cached_mock_responses")
 def test_osv_adapter():
     """Test OSV adapter can load and normalize mock responses."""
     config = {
@@ -128,11 +177,28 @@ def test_osv_adapter():
     assert obs.source_id == "osv"
     assert obs.package_name is not None
 
-    print(f"✓ OsvAdapter: Loaded {len(observations)} observations")
+    logger.debug("✓ OsvAdapter: Loaded %d observations", len(observations))
+
+
+@pytest.mark.parametrize("adapter_cls,mock_file", [
+    (NvdAdapter, "ingestion/mock_responses/nvd_responses.json"),
+    (OsvAdapter, "ingestion/mock_responses/osv_responses.json"),
+])
+def test_adapter_reads_mock_file_directly(adapter_cls, mock_file):
+    """Test the adapters' own _load_mock matches the cached test path."""
+    adapter = adapter_cls({"use_mock": True, "mock_file": mock_file})
+
+    observations = adapter.fetch()
+
+    assert len(observations) > 0
+    assert adapter._load_mock() == load_mock(mock_file)
 
 
 def main():
     """Run all tests."""
+    # Show the per-adapter debug lines when run as a script
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
     print("Running adapter validation tests...\n")
 
     try:
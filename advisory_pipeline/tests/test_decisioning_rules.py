@@ -4,12 +4,6 @@ Tests for decision rules.
 Validates that each rule correctly evaluates advisory data and
 produces expected decisions.
 """
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
 from decisioning.rules import (
     CsvOverrideRule,
@@ -21,11 +15,35 @@ from decisioning.rules import (
 )
 
 
+@pytest.fixture(scope="module")
+def csv_override_rule():
+    return CsvOverrideRule()
+
+
+@pytest.fixture(scope="module")
+def nvd_rejected_rule():
+    return NvdRejectedRule()
+
+
+@pytest.fixture(scope="module")
+def upstream_fix_rule():
+    return UpstreamFixRule()
+
+
+@pytest.fixture(scope="module")
+def under_investigation_rule():
+    return UnderInvestigationRule()
+
+
+@pytest.fixture(scope="module")
+def pending_upstream_rule():
+    return PendingUpstreamRule()
+
+
 class TestCsvOverrideRule:
     """Test CSV override rule (R0)."""
 
-    def test_matches_not_applicable_override(self):
-        rule = CsvOverrideRule()
+    def test_matches_not_applicable_override(self, csv_override_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'override_status': 'not_applicable',
@@ -33,7 +51,7 @@ class TestCsvOverrideRule:
             'csv_updated_at': '2024-01-15'
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = csv_override_rule.evaluate(advisory_data)
 
         assert decision is not None
         assert decision.state == 'not_applicable'
@@ -42,29 +60,27 @@ class TestCsvOverrideRule:
         assert decision.reason_code == 'CSV_OVERRIDE'
         assert 'csv_override' in decision.evidence
 
-    def test_no_match_when_no_override(self):
-        rule = CsvOverrideRule()
+    def test_no_match_when_no_override(self, csv_override_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'override_status': None
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = csv_override_rule.evaluate(advisory_data)
         assert decision is None
 
 
 class TestNvdRejectedRule:
     """Test NVD rejected rule (R1)."""
 
-    def test_matches_rejected_cve(self):
-        rule = NvdRejectedRule()
+    def test_matches_rejected_cve(self, nvd_rejected_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0002',
             'is_rejected': True,
             'nvd_rejection_status': 'rejected'
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = nvd_rejected_rule.evaluate(advisory_data)
 
         assert decision is not None
         assert decision.state == 'not_applicable'
@@ -72,22 +88,20 @@ class TestNvdRejectedRule:
         assert decision.confidence == 'high'
         assert decision.reason_code == 'NVD_REJECTED'
 
-    def test_no_match_when_not_rejected(self):
-        rule = NvdRejectedRule()
+    def test_no_match_when_not_rejected(self, nvd_rejected_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'is_rejected': False
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = nvd_rejected_rule.evaluate(advisory_data)
         assert decision is None
 
 
 class TestUpstreamFixRule:
     """Test upstream fix rule (R2)."""
 
-    def test_matches_when_fix_available(self):
-        rule = UpstreamFixRule()
+    def test_matches_when_fix_available(self, upstream_fix_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'fix_available': True,
@@ -96,7 +110,7 @@ class TestUpstreamFixRule:
             'contributing_sources': ['osv', 'nvd']
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = upstream_fix_rule.evaluate(advisory_data)
 
         assert decision is not None
         assert decision.state == 'fixed'
@@ -105,34 +119,24 @@ class TestUpstreamFixRule:
         assert decision.confidence == 'high'
         assert decision.reason_code == 'UPSTREAM_FIX'
 
-    def test_no_match_when_no_version(self):
-        rule = UpstreamFixRule()
-        advisory_data = {
-            'advisory_id': 'pkg:CVE-2024-0001',
-            'fix_available': True,
-            'fixed_version': None
-        }
-
-        decision = rule.evaluate(advisory_data)
-        assert decision is None
-
-    def test_no_match_when_fix_not_available(self):
-        rule = UpstreamFixRule()
-        advisory_data = {
-            'advisory_id': 'pkg:CVE-2024-0001',
-            'fix_available': False,
-            'fixed_version': '1.2.3'
-        }
-
-        decision = rule.evaluate(advisory_data)
-        assert decision is None
+    @pytest.mark.parametrize("advisory_data", [
+        pytest.param(
+            {'advisory_id': 'pkg:CVE-2024-0001', 'fix_available': True, 'fixed_version': None},
+            id="no_version",
+        ),
+        pytest.param(
+            {'advisory_id': 'pkg:CVE-2024-0001', 'fix_available': False, 'fixed_version': '1.2.3'},
+            id="fix_not_available",
+        ),
+    ])
+    def test_no_match(self, upstream_fix_rule, advisory_data):
+        assert upstream_fix_rule.evaluate(advisory_data) is None
 
 
 class TestUnderInvestigationRule:
     """Test under investigation rule (R5)."""
 
-    def test_matches_when_no_signals(self):
-        rule = UnderInvestigationRule()
+    def test_matches_when_no_signals(self, under_investigation_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0004',
             'has_signal': False,
@@ -140,7 +144,7 @@ class TestUnderInvestigationRule:
             'contributing_sources': ['echo_data']
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = under_investigation_rule.evaluate(advisory_data)
 
         assert decision is not None
         assert decision.state == 'under_investigation'
@@ -148,22 +152,20 @@ class TestUnderInvestigationRule:
         assert decision.confidence == 'low'
         assert decision.reason_code == 'NEW_CVE'
 
-    def test_no_match_when_has_signals(self):
-        rule = UnderInvestigationRule()
+    def test_no_match_when_has_signals(self, under_investigation_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'has_signal': True
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = under_investigation_rule.evaluate(advisory_data)
         assert decision is None
 
 
 class TestPendingUpstreamRule:
     """Test pending upstream rule (R6) - default fallback."""
 
-    def test_always_matches(self):
-        rule = PendingUpstreamRule()
+    def test_always_matches(self, pending_upstream_rule):
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0003',
             'contributing_sources': ['nvd', 'echo_data'],
@@ -171,7 +173,7 @@ class TestPendingUpstreamRule:
             'cvss_score': 7.5
         }
 
-        decision = rule.evaluate(advisory_data)
+        decision = pending_upstream_rule.evaluate(advisory_data)
 
         assert decision is not None
         assert decision.state == 'pending_upstream'
@@ -3,12 +3,6 @@ Tests for decision explainer.
 
 Validates explanation generation from templates and evidence.
 """
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
 from decisioning import DecisionExplainer
 
@@ -16,10 +10,8 @@ from decisioning import DecisionExplainer
 class TestDecisionExplainer:
     """Test explanation generation."""
 
-    def test_csv_override_explanation(self):
+    def test_csv_override_explanation(self, explainer):
         """Should generate correct CSV override explanation."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'csv_reason': 'False positive - code not used in production',
             'csv_updated_at': '2024-01-15T10:30:00'
@@ -31,10 +23,8 @@ class TestDecisionExplainer:
         assert 'False positive - code not used in production' in explanation
         assert '2024-01-15' in explanation
 
-    def test_nvd_rejected_explanation(self):
+    def test_nvd_rejected_explanation(self, explainer):
         """Should generate correct NVD rejected explanation."""
-        explainer = DecisionExplainer()
-
         evidence = {'is_rejected': True}
 
         explanation = explainer.explain('NVD_REJECTED', evidence)
@@ -42,10 +32,8 @@ class TestDecisionExplainer:
         assert 'rejected' in explanation.lower()
         assert 'National Vulnerability Database' in explanation
 
-    def test_upstream_fix_explanation(self):
+    def test_upstream_fix_explanation(self, explainer):
         """Should generate correct upstream fix explanation."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'fix_available': True,
             'fixed_version': '2.1.0'
@@ -57,10 +45,8 @@ class TestDecisionExplainer:
         assert 'Fixed in version' in explanation
         assert 'upstream' in explanation.lower()
 
-    def test_new_cve_explanation(self):
+    def test_new_cve_explanation(self, explainer):
         """Should generate correct new CVE explanation."""
-        explainer = DecisionExplainer()
-
         evidence = {'has_signal': False}
 
         explanation = explainer.explain('NEW_CVE', evidence)
@@ -68,10 +54,8 @@ class TestDecisionExplainer:
         assert 'under analysis' in explanation.lower()
         assert 'awaiting' in explanation.lower()
 
-    def test_awaiting_fix_explanation(self):
+    def test_awaiting_fix_explanation(self, explainer):
         """Should generate correct awaiting fix explanation."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'contributing_sources': ['nvd', 'osv', 'echo_data']
         }
@@ -81,10 +65,8 @@ class TestDecisionExplainer:
         assert 'No fix currently available' in explanation
         assert 'nvd, osv, echo_data' in explanation
 
-    def test_handles_missing_template_variables(self):
+    def test_handles_missing_template_variables(self, explainer):
         """Should handle missing template variables gracefully."""
-        explainer = DecisionExplainer()
-
         evidence = {}  # Missing expected fields
 
         # Should not raise, should use defaults
@@ -92,10 +74,8 @@ class TestDecisionExplainer:
 
         assert 'unknown' in explanation.lower() or 'internal policy' in explanation.lower()
 
-    def test_handles_none_values(self):
+    def test_handles_none_values(self, explainer):
         """Should handle None values in evidence."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'csv_reason': None,
             'csv_updated_at': None
@@ -106,10 +86,8 @@ class TestDecisionExplainer:
         assert explanation  # Should generate something
         assert 'none' not in explanation.lower()  # Should substitute defaults
 
-    def test_formats_dates_correctly(self):
+    def test_formats_dates_correctly(self, explainer):
         """Should format datetime strings to readable dates."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'csv_reason': 'Test',
             'csv_updated_at': '2024-01-15T14:30:00Z'
@@ -120,10 +98,8 @@ class TestDecisionExplainer:
         assert '2024-01-15' in explanation
         assert 'T14:30:00' not in explanation  # Should strip time
 
-    def test_handles_empty_sources_list(self):
+    def test_handles_empty_sources_list(self, explainer):
         """Should handle empty sources list gracefully."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'contributing_sources': []
         }
@@ -132,10 +108,8 @@ class TestDecisionExplainer:
 
         assert 'none' in explanation.lower()
 
-    def test_fallback_for_unknown_reason_code(self):
+    def test_fallback_for_unknown_reason_code(self, explainer):
         """Should provide fallback explanation for unknown reason codes."""
-        explainer = DecisionExplainer()
-
         evidence = {'state': 'pending_upstream'}
 
         explanation = explainer.explain('UNKNOWN_REASON', evidence)
@@ -161,10 +135,8 @@ class TestDecisionExplainer:
         assert 'value1' in explanation
         assert 'value2' in explanation
 
-    def test_explain_with_context_includes_metadata(self):
+    def test_explain_with_context_includes_metadata(self, explainer):
         """Should include metadata when requested."""
-        explainer = DecisionExplainer()
-
         evidence = {
             'confidence': 'high',
             'applied_rule': 'R2',
@@ -185,10 +157,8 @@ class TestDecisionExplainer:
         assert result['metadata']['applied_rule'] == 'R2'
         assert result['metadata']['source_count'] == 3
 
-    def test_explain_with_context_excludes_metadata_by_default(self):
+    def test_explain_with_context_excludes_metadata_by_default(self, explainer):
         """Should exclude metadata by default."""
-        explainer = DecisionExplainer()
-
         evidence = {'fix_available': True}
 
         result = explainer.explain_with_context(
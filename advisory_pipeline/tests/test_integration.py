@@ -4,24 +4,18 @@ End-to-end integration tests for the advisory pipeline.
 These tests validate the full pipeline flow from ingestion through
 decisioning, ensuring components work together correctly.
 """
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
-from datetime import datetime
 
 from storage import Database, SourceLoader
 from ingestion.base_adapter import SourceObservation
 from decisioning import RuleEngine
+from _fixtures import NOW
 
 
 class TestEndToEndPipeline:
     """Integration tests for complete pipeline flow."""
 
-    def test_full_pipeline_flow(self, temp_db, loader):
+    def test_full_pipeline_flow(self, ro_conn, loader):
         """
         Test complete pipeline: ingest -> load -> query.
 
@@ -36,7 +30,7 @@ class TestEndToEndPipeline:
                 source_id="echo_data",
                 cve_id="CVE-2024-1001",
                 package_name="test-lib",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={"source": "echo"},
                 status="open",
                 cvss_score=7.0,
@@ -50,7 +44,7 @@ class TestEndToEndPipeline:
                 source_id="nvd",
                 cve_id="CVE-2024-1001",
                 package_name=None,
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={"source": "nvd"},
                 rejection_status="none",
                 cvss_score=7.5,
@@ -64,7 +58,7 @@ class TestEndToEndPipeline:
                 source_id="osv",
                 cve_id="CVE-2024-1001",
                 package_name="test-lib",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={"source": "osv"},
                 fix_available=True,
                 fixed_version="2.0.0",
@@ -80,36 +74,34 @@ class TestEndToEndPipeline:
         assert counts["osv"] == 1
 
         # 3. Verify data is queryable
-        conn = temp_db.connect()
+        conn = ro_conn
+
+        # One query across all three sources, keyed by source
+        rows = conn.execute("""
+            SELECT 'echo', cve_id, package_name, NULL::DOUBLE, NULL
+            FROM raw_echo_advisories WHERE run_id = ?
+            UNION ALL
+            SELECT 'nvd', cve_id, NULL, cvss_score, NULL
+            FROM raw_nvd_observations WHERE run_id = ?
+            UNION ALL
+            SELECT 'osv', cve_id, NULL, NULL, fixed_version
+            FROM raw_osv_observations WHERE run_id = ?
+        """, [run_id] * 3).fetchall()
+        by_source = {row[0]: row for row in rows}
 
         # Check Echo data
-        echo_result = conn.execute("""
-            SELECT cve_id, package_name FROM raw_echo_advisories
-            WHERE run_id = ?
-        """, [run_id]).fetchone()
-
-        assert echo_result[0] == "CVE-2024-1001"
-        assert echo_result[1] == "test-lib"
+        assert by_source["echo"][1] == "CVE-2024-1001"
+        assert by_source["echo"][2] == "test-lib"
 
         # Check NVD data
-        nvd_result = conn.execute("""
-            SELECT cve_id, cvss_score FROM raw_nvd_observations
-            WHERE run_id = ?
-        """, [run_id]).fetchone()
-
-        assert nvd_result[0] == "CVE-2024-1001"
-        assert nvd_result[1] == 7.5
+        assert by_source["nvd"][1] == "CVE-2024-1001"
+        assert by_source["nvd"][3] == 7.5
 
         # Check OSV data
-        osv_result = conn.execute("""
-            SELECT cve_id, fixed_version FROM raw_osv_observations
-            WHERE run_id = ?
-        """, [run_id]).fetchone()
+        assert by_source["osv"][1] == "CVE-2024-1001"
+        assert by_source["osv"][4] == "2.0.0"
 
-        assert osv_result[0] == "CVE-2024-1001"
-        assert osv_result[1] == "2.0.0"
-
-    def test_csv_override_integration(self, temp_db, loader):
+    def test_csv_override_integration(self, ro_conn, loader):
         """
         Test that CSV overrides correctly override other sources.
 
@@ -124,7 +116,7 @@ class TestEndToEndPipeline:
                 source_id="osv",
                 cve_id="CVE-2024-1002",
                 package_name="override-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={},
                 fix_available=True,
                 fixed_version="1.5.0"
@@ -138,8 +130,8 @@ class TestEndToEndPipeline:
                 source_id="echo_csv",
                 cve_id="CVE-2024-1002",
                 package_name="override-test",
-                observed_at=datetime.utcnow(),
-                source_updated_at=datetime.utcnow(),
+                observed_at=NOW,
+                source_updated_at=NOW,
                 raw_payload={"analyst": "test"},
                 status="not_applicable",
                 notes="Service not exposed"
@@ -152,7 +144,7 @@ class TestEndToEndPipeline:
         assert counts["osv"] == 1
 
         # Both observations should be in database
-        conn = temp_db.connect()
+        conn = ro_conn
 
         csv_count = conn.execute(
             "SELECT COUNT(*) FROM raw_echo_csv WHERE run_id = ?", [run_id]
@@ -164,7 +156,7 @@ class TestEndToEndPipeline:
         ).fetchone()[0]
         assert osv_count == 1
 
-    def test_nvd_rejection_integration(self, temp_db, loader):
+    def test_nvd_rejection_integration(self, ro_conn, loader):
         """
         Test NVD rejection handling.
 
@@ -178,7 +170,7 @@ class TestEndToEndPipeline:
                 source_id="nvd",
                 cve_id="CVE-2024-1003",
                 package_name=None,
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={"vulnStatus": "Rejected"},
                 rejection_status="rejected",
                 notes="Duplicate of CVE-2023-9999"
@@ -189,7 +181,7 @@ class TestEndToEndPipeline:
         assert count == 1
 
         # Verify rejection status stored
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
             SELECT rejection_status FROM raw_nvd_observations
             WHERE cve_id = ? AND run_id = ?
@@ -197,7 +189,7 @@ class TestEndToEndPipeline:
 
         assert result[0] == "rejected"
 
-    def test_multiple_runs_idempotent(self, temp_db, loader):
+    def test_multiple_runs_idempotent(self, ro_conn, loader):
         """
         Test that multiple pipeline runs are idempotent for same data.
 
@@ -211,7 +203,7 @@ class TestEndToEndPipeline:
                 source_id="echo_data",
                 cve_id="CVE-2024-1004",
                 package_name="multi-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -224,14 +216,14 @@ class TestEndToEndPipeline:
         assert count2 == 1
 
         # Should only have one record
-        conn = temp_db.connect()
+        conn = ro_conn
         total = conn.execute("""
             SELECT COUNT(*) FROM raw_echo_advisories WHERE run_id = ?
         """, [run_id]).fetchone()[0]
 
         assert total == 1
 
-    def test_package_name_null_handling(self, temp_db, loader):
+    def test_package_name_null_handling(self, ro_conn, loader):
         """
         Test that NULL package names are handled correctly.
 
@@ -246,7 +238,7 @@ class TestEndToEndPipeline:
                 source_id="osv",
                 cve_id="CVE-2024-1005",
                 package_name=None,  # Sometimes package info unavailable
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={},
                 fix_available=False
             )
@@ -256,7 +248,7 @@ class TestEndToEndPipeline:
         assert count == 1
 
         # Verify NULL stored correctly
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
             SELECT package_name FROM raw_osv_observations
             WHERE cve_id = ? AND run_id = ?
@@ -264,7 +256,7 @@ class TestEndToEndPipeline:
 
         assert result[0] is None
 
-    def test_json_payload_preservation(self, temp_db, loader):
+    def test_json_payload_preservation(self, ro_conn, loader):
         """
         Test that raw JSON payloads are preserved correctly.
 
@@ -286,7 +278,7 @@ class TestEndToEndPipeline:
                 source_id="echo_data",
                 cve_id="CVE-2024-1006",
                 package_name="json-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload=complex_payload
             )
         ]
@@ -294,7 +286,7 @@ class TestEndToEndPipeline:
         loader.load_echo_advisories(obs, run_id)
 
         # Verify JSON round-trip
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
             SELECT raw_payload FROM raw_echo_advisories
             WHERE observation_id = ?
@@ -311,7 +303,7 @@ class TestEndToEndPipeline:
 class TestCrossSourceJoins:
     """Test queries that join across multiple source tables."""
 
-    def test_join_echo_and_nvd(self, temp_db, loader):
+    def test_join_echo_and_nvd(self, ro_conn, loader):
         """
         Test joining Echo advisories with NVD observations.
 
@@ -325,7 +317,7 @@ class TestCrossSourceJoins:
                 source_id="echo_data",
                 cve_id="CVE-2024-2001",
                 package_name="join-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -336,7 +328,7 @@ class TestCrossSourceJoins:
                 source_id="nvd",
                 cve_id="CVE-2024-2001",
                 package_name=None,
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={},
                 cvss_score=9.1
             )
@@ -345,7 +337,7 @@ class TestCrossSourceJoins:
         loader.load_all(echo_obs, [], nvd_obs, [], run_id)
 
         # Join on CVE ID
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
             SELECT
                 e.package_name,
@@ -361,7 +353,7 @@ class TestCrossSourceJoins:
         assert result[1] == "CVE-2024-2001"
         assert result[2] == 9.1
 
-    def test_left_join_with_missing_osv(self, temp_db, loader):
+    def test_left_join_with_missing_osv(self, ro_conn, loader):
         """
         Test LEFT JOIN when OSV data is missing.
 
@@ -375,7 +367,7 @@ class TestCrossSourceJoins:
                 source_id="echo_data",
                 cve_id="CVE-2024-2002",
                 package_name="no-osv-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -383,7 +375,7 @@ class TestCrossSourceJoins:
         loader.load_echo_advisories(echo_obs, run_id)
 
         # LEFT JOIN should still return Echo row
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
             SELECT
                 e.cve_id,
@@ -398,7 +390,7 @@ class TestCrossSourceJoins:
         assert result[0] == "CVE-2024-2002"
         assert result[1] is None  # No OSV data
 
-    def test_aggregate_by_cve(self, temp_db, loader):
+    def test_aggregate_by_cve(self, ro_conn, loader):
         """
         Test aggregating observations by CVE ID.
 
@@ -413,7 +405,7 @@ class TestCrossSourceJoins:
                 source_id="echo_data",
                 cve_id="CVE-2024-3001",
                 package_name="agg-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -424,7 +416,7 @@ class TestCrossSourceJoins:
                 source_id="nvd",
                 cve_id="CVE-2024-3001",
                 package_name=None,
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -435,7 +427,7 @@ class TestCrossSourceJoins:
                 source_id="osv",
                 cve_id="CVE-2024-3001",
                 package_name="agg-test",
-                observed_at=datetime.utcnow(),
+                observed_at=NOW,
                 raw_payload={}
             )
         ]
@@ -443,15 +435,11 @@ class TestCrossSourceJoins:
         loader.load_all(echo_obs, [], nvd_obs, osv_obs, run_id)
 
         # Count sources per CVE
-        conn = temp_db.connect()
+        conn = ro_conn
         result = conn.execute("""
-            SELECT COUNT(*) as source_count FROM (
-                SELECT cve_id FROM raw_echo_advisories WHERE run_id = ?
-                UNION ALL
-                SELECT cve_id FROM raw_nvd_observations WHERE run_id = ?
-                UNION ALL
-                SELECT cve_id FROM raw_osv_observations WHERE run_id = ?
-            ) WHERE cve_id = 'CVE-2024-3001'
-        """, [run_id, run_id, run_id]).fetchone()
+            SELECT COUNT(*) as source_count
+            FROM all_raw_observations
+            WHERE run_id = ? AND cve_id = 'CVE-2024-3001'
+        """, [run_id]).fetchone()
 
         assert result[0] == 3  # Three sources for same CVE
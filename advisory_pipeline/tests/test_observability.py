@@ -12,16 +12,15 @@ the observability layer can be integrated into the pipeline.
 """
 import pytest
 from datetime import datetime
-from pathlib import Path
-import tempfile
 
 from observability import RunMetrics, QualityChecker, QualityCheckResult, RunReporter
 from storage.database import Database
+from _fixtures import NOW
 
 
 def test_run_metrics_tracks_transitions():
     """Verify RunMetrics correctly tracks state transitions."""
-    metrics = RunMetrics(run_id="test_run", started_at=datetime.utcnow())
+    metrics = RunMetrics(run_id="test_run", started_at=NOW)
 
     # Record some transitions
     metrics.record_transition("unknown", "pending_upstream")
@@ -35,7 +34,7 @@ def test_run_metrics_tracks_transitions():
 
 def test_run_metrics_tracks_rules():
     """Verify RunMetrics correctly tracks rule firing."""
-    metrics = RunMetrics(run_id="test_run", started_at=datetime.utcnow())
+    metrics = RunMetrics(run_id="test_run", started_at=NOW)
 
     metrics.record_rule_fired("R0:csv_override")
     metrics.record_rule_fired("R2:upstream_fix")
@@ -69,24 +68,23 @@ def test_run_metrics_serialization():
 
 def test_quality_checker_runs_on_empty_db():
     """Verify QualityChecker can run on empty database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db = Database(f"{tmpdir}/test.duckdb")
-        db.initialize_schema()
+    db = Database(":memory:")
+    db.initialize_schema()
 
-        checker = QualityChecker(db)
-        results = checker.run_all_checks()
+    checker = QualityChecker(db)
+    results = checker.run_all_checks()
 
-        # Should return results for all checks
-        assert len(results) == 6
+    # Should return results for all checks
+    assert len(results) == 6
 
-        # All results should be QualityCheckResult instances
-        for result in results:
-            assert isinstance(result, QualityCheckResult)
-            assert result.check_name
-            assert isinstance(result.passed, bool)
-            assert result.message
+    # All results should be QualityCheckResult instances
+    for result in results:
+        assert isinstance(result, QualityCheckResult)
+        assert result.check_name
+        assert isinstance(result.passed, bool)
+        assert result.message
 
-        db.close()
+    db.close()
 
 
 def test_quality_check_result_structure():
@@ -133,30 +131,28 @@ def test_reporter_generates_markdown():
     assert "15" in report  # State changes
 
 
-def test_reporter_saves_to_file():
+def test_reporter_saves_to_file(tmp_path):
     """Verify RunReporter can save reports to file."""
-    metrics = RunMetrics(run_id="test_run", started_at=datetime.utcnow())
+    metrics = RunMetrics(run_id="test_run", started_at=NOW)
     quality_results = []
 
     reporter = RunReporter()
     report = reporter.generate_report(metrics, quality_results)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_dir = Path(tmpdir)
-        report_path = reporter.save_report(report, output_dir)
+    report_path = reporter.save_report(report, tmp_path)
 
-        assert report_path.exists()
-        assert report_path.name.startswith("run-report-")
-        assert report_path.suffix == ".md"
+    assert report_path.exists()
+    assert report_path.name.startswith("run-report-")
+    assert report_path.suffix == ".md"
 
-        # Verify content was written
-        content = report_path.read_text()
-        assert "Pipeline Run Report" in content
+    # Verify content was written
+    content = report_path.read_text()
+    assert "Pipeline Run Report" in content
 
 
 def test_run_metrics_error_tracking():
     """Verify RunMetrics tracks errors correctly."""
-    metrics = RunMetrics(run_id="test_run", started_at=datetime.utcnow())
+    metrics = RunMetrics(run_id="test_run", started_at=NOW)
 
     metrics.record_error("Test error 1")
     metrics.record_error("Test error 2", context={"advisory_id": "test:CVE-2024-0001"})
@@ -4,23 +4,14 @@ Tests for the rule engine.
 Validates that the engine correctly applies the rule chain and
 produces deterministic decisions.
 """
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
-from decisioning import RuleEngine, get_default_rules
 
 
 class TestRuleEngine:
     """Test rule engine execution."""
 
-    def test_applies_first_matching_rule(self):
+    def test_applies_first_matching_rule(self, engine):
         """Engine should return first matching rule's decision."""
-        engine = RuleEngine()
-
         # CSV override should match first (priority 0)
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
@@ -35,10 +26,8 @@ class TestRuleEngine:
         assert decision.state == 'not_applicable'
         assert decision.evidence['applied_rule'] == 'R0'
 
-    def test_fallback_to_pending_upstream(self):
+    def test_fallback_to_pending_upstream(self, engine):
         """Should fall back to R6 when no higher priority rules match."""
-        engine = RuleEngine()
-
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0003',
             'override_status': None,
@@ -56,10 +45,8 @@ class TestRuleEngine:
         assert decision.state == 'pending_upstream'
         assert decision.state_type == 'non_final'
 
-    def test_upstream_fix_rule(self):
+    def test_upstream_fix_rule(self, engine):
         """R2 should match when fix is available."""
-        engine = RuleEngine()
-
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'override_status': None,
@@ -75,10 +62,8 @@ class TestRuleEngine:
         assert decision.state == 'fixed'
         assert decision.fixed_version == '2.0.0'
 
-    def test_under_investigation_for_new_cve(self):
+    def test_under_investigation_for_new_cve(self, engine):
         """R5 should match for new CVEs with no signals."""
-        engine = RuleEngine()
-
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-9999',
             'override_status': None,
@@ -95,10 +80,8 @@ class TestRuleEngine:
         assert decision.state == 'under_investigation'
         assert decision.confidence == 'low'
 
-    def test_decide_batch_processes_multiple_advisories(self):
+    def test_decide_batch_processes_multiple_advisories(self, engine):
         """Batch processing should handle multiple advisories."""
-        engine = RuleEngine()
-
         advisories = [
             {
                 'advisory_id': 'pkg1:CVE-2024-0001',
@@ -123,10 +106,23 @@ class TestRuleEngine:
         assert decisions[1].reason_code == 'NVD_REJECTED'
         assert decisions[2].reason_code == 'UPSTREAM_FIX'
 
-    def test_explain_decision_provides_trace(self):
-        """Explain decision should provide full evaluation trace."""
-        engine = RuleEngine()
+    def test_decide_batch_parallel_matches_serial(self, engine):
+        """Parallel batch processing should return the same decisions in order."""
+        advisories = [
+            {'advisory_id': f'pkg{i}:CVE-2024-{i:04d}', 'fix_available': True, 'fixed_version': f'1.0.{i}'}
+            if i % 2 else
+            {'advisory_id': f'pkg{i}:CVE-2024-{i:04d}', 'is_rejected': True}
+            for i in range(200)
+        ]
+
+        serial = engine.decide_batch(advisories)
+        parallel = engine.decide_batch(advisories, parallel=True)
+
+        assert [d.reason_code for d in parallel] == [d.reason_code for d in serial]
+        assert [d.fixed_version for d in parallel] == [d.fixed_version for d in serial]
 
+    def test_explain_decision_provides_trace(self, engine):
+        """Explain decision should provide full evaluation trace."""
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'fix_available': True,
@@ -151,10 +147,24 @@ class TestRuleEngine:
         r2_trace = next(t for t in trace if t['rule_id'] == 'R2')
         assert r2_trace['matched'] is True
 
-    def test_deterministic_decisions(self):
-        """Same input should always produce same decision."""
-        engine = RuleEngine()
+    def test_explain_decision_stop_after_match(self, engine):
+        """Explain decision can stop tracing at the first matching rule."""
+        advisory_data = {
+            'advisory_id': 'pkg:CVE-2024-0001',
+            'fix_available': True,
+            'fixed_version': '1.2.3'
+        }
+
+        explanation = engine.explain_decision(advisory_data, stop_after_match=True)
 
+        trace = explanation['evaluation_trace']
+        assert [t['rule_id'] for t in trace] == ['R0', 'R1', 'R2']
+        assert trace[-1]['matched'] is True
+        assert explanation['total_rules_evaluated'] == 3
+        assert explanation['decision'].reason_code == 'UPSTREAM_FIX'
+
+    def test_deterministic_decisions(self, engine):
+        """Same input should always produce same decision."""
         advisory_data = {
             'advisory_id': 'pkg:CVE-2024-0001',
             'fix_available': True,
@@ -3,79 +3,61 @@ Tests for advisory state machine.
 
 Validates state transition rules and prevents invalid regressions.
 """
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import itertools
 
 import pytest
 from decisioning import AdvisoryStateMachine, StateType
 
+# Sorted so parametrized test ids are stable across runs
+FINAL_STATES = sorted(AdvisoryStateMachine.FINAL_STATES)
+NON_FINAL_STATES = sorted(AdvisoryStateMachine.NON_FINAL_STATES)
+ALL_STATES = FINAL_STATES + NON_FINAL_STATES
+
+
+@pytest.fixture(scope="class")
+def sm():
+    """One state machine shared per test class; it holds no per-call state."""
+    return AdvisoryStateMachine()
+
 
 class TestAdvisoryStateMachine:
     """Test state transition validation."""
 
-    def test_new_advisory_allows_any_state(self):
+    @pytest.mark.parametrize("state", ALL_STATES)
+    def test_new_advisory_allows_any_state(self, sm, state):
         """New advisories (no current state) can enter any valid state."""
-        sm = AdvisoryStateMachine()
-
-        for state in ['fixed', 'not_applicable', 'pending_upstream', 'under_investigation']:
-            is_valid, reason = sm.validate_transition(None, state)
-            assert is_valid
-            assert reason is None
+        is_valid, reason = sm.validate_transition(None, state)
+        assert is_valid
+        assert reason is None
 
-    def test_non_final_to_any_allowed(self):
+    @pytest.mark.parametrize("current,target", list(itertools.product(NON_FINAL_STATES, ALL_STATES)))
+    def test_non_final_to_any_allowed(self, sm, current, target):
         """Non-final states can transition to any state."""
-        sm = AdvisoryStateMachine()
+        is_valid, reason = sm.validate_transition(current, target)
+        assert is_valid, f"{current} -> {target} should be valid"
 
-        non_final_states = ['pending_upstream', 'under_investigation', 'unknown']
-        target_states = ['fixed', 'not_applicable', 'wont_fix', 'pending_upstream']
-
-        for current in non_final_states:
-            for target in target_states:
-                is_valid, reason = sm.validate_transition(current, target)
-                assert is_valid, f"{current} -> {target} should be valid"
-
-    def test_final_to_non_final_rejected(self):
+    @pytest.mark.parametrize("current,target", list(itertools.product(FINAL_STATES, NON_FINAL_STATES)))
+    def test_final_to_non_final_rejected(self, sm, current, target):
         """Final states cannot transition to non-final (regression)."""
-        sm = AdvisoryStateMachine()
-
-        final_states = ['fixed', 'not_applicable', 'wont_fix']
-        non_final_states = ['pending_upstream', 'under_investigation', 'unknown']
+        is_valid, reason = sm.validate_transition(current, target)
+        assert not is_valid, f"{current} -> {target} should be rejected"
+        assert 'regression' in reason.lower()
 
-        for current in final_states:
-            for target in non_final_states:
-                is_valid, reason = sm.validate_transition(current, target)
-                assert not is_valid, f"{current} -> {target} should be rejected"
-                assert 'regression' in reason.lower()
-
-    def test_final_to_final_allowed(self):
+    @pytest.mark.parametrize("current,target", list(itertools.product(FINAL_STATES, FINAL_STATES)))
+    def test_final_to_final_allowed(self, sm, current, target):
         """Final states can transition to other final states."""
-        sm = AdvisoryStateMachine()
-
-        final_states = ['fixed', 'not_applicable', 'wont_fix']
-
-        for current in final_states:
-            for target in final_states:
-                is_valid, reason = sm.validate_transition(current, target)
-                assert is_valid, f"{current} -> {target} should be valid"
+        is_valid, reason = sm.validate_transition(current, target)
+        assert is_valid, f"{current} -> {target} should be valid"
 
-    def test_same_state_transition_allowed(self):
+    @pytest.mark.parametrize("state", ALL_STATES)
+    def test_same_state_transition_allowed(self, sm, state):
         """Transitioning to same state is always allowed (re-confirmation)."""
-        sm = AdvisoryStateMachine()
-
-        all_states = ['fixed', 'not_applicable', 'pending_upstream', 'under_investigation']
-
-        for state in all_states:
-            is_valid, reason = sm.validate_transition(state, state)
-            assert is_valid
-            assert reason is None
+        is_valid, reason = sm.validate_transition(state, state)
+        assert is_valid
+        assert reason is None
 
-    def test_allow_regressions_flag(self):
+    def test_allow_regressions_flag(self, sm):
         """Regressions can be allowed if flag is set."""
-        sm = AdvisoryStateMachine()
-
         # Normally rejected
         is_valid, reason = sm.validate_transition('fixed', 'pending_upstream', allow_regressions=False)
         assert not is_valid
@@ -84,10 +66,8 @@ class TestAdvisoryStateMachine:
         is_valid, reason = sm.validate_transition('fixed', 'pending_upstream', allow_regressions=True)
         assert is_valid
 
-    def test_invalid_states_rejected(self):
+    def test_invalid_states_rejected(self, sm):
         """Invalid state names should be rejected."""
-        sm = AdvisoryStateMachine()
-
         is_valid, reason = sm.validate_transition(None, 'invalid_state')
         assert not is_valid
         assert 'invalid' in reason.lower()
@@ -96,10 +76,8 @@ class TestAdvisoryStateMachine:
         assert not is_valid
         assert 'invalid' in reason.lower()
 
-    def test_get_state_type(self):
+    def test_get_state_type(self, sm):
         """Should correctly classify states."""
-        sm = AdvisoryStateMachine()
-
         assert sm.get_state_type('fixed') == StateType.FINAL
         assert sm.get_state_type('not_applicable') == StateType.FINAL
         assert sm.get_state_type('wont_fix') == StateType.FINAL
@@ -110,10 +88,8 @@ class TestAdvisoryStateMachine:
 
         assert sm.get_state_type('invalid') is None
 
-    def test_is_final_state(self):
+    def test_is_final_state(self, sm):
         """Should correctly identify final states."""
-        sm = AdvisoryStateMachine()
-
         assert sm.is_final_state('fixed')
         assert sm.is_final_state('not_applicable')
         assert sm.is_final_state('wont_fix')
@@ -122,10 +98,8 @@ class TestAdvisoryStateMachine:
         assert not sm.is_final_state('under_investigation')
         assert not sm.is_final_state('unknown')
 
-    def test_get_allowed_transitions(self):
+    def test_get_allowed_transitions(self, sm):
         """Should return correct allowed transitions."""
-        sm = AdvisoryStateMachine()
-
         # Non-final can go anywhere
         allowed = sm.get_allowed_transitions('pending_upstream')
         assert 'fixed' in allowed
@@ -139,10 +113,8 @@ class TestAdvisoryStateMachine:
         assert 'pending_upstream' not in allowed
         assert 'under_investigation' not in allowed
 
-    def test_describe_transition(self):
+    def test_describe_transition(self, sm):
         """Should provide detailed transition description."""
-        sm = AdvisoryStateMachine()
-
         description = sm.describe_transition('pending_upstream', 'fixed')
 
         assert description['from_state'] == 'pending_upstream'
@@ -152,16 +124,23 @@ class TestAdvisoryStateMachine:
         assert description['to_type'] == 'final'
         assert description['is_regression'] is False
 
-    def test_describe_regression(self):
+    def test_describe_regression(self, sm):
         """Should identify regressions in description."""
-        sm = AdvisoryStateMachine()
-
         description = sm.describe_transition('fixed', 'pending_upstream')
 
         assert description['is_valid'] is False
         assert description['is_regression'] is True
         assert 'regression' in description['rejection_reason'].lower()
 
+    def test_describe_transition_is_cached(self, sm):
+        """Repeated descriptions should reuse one read-only mapping."""
+        first = sm.describe_transition('pending_upstream', 'fixed')
+        second = sm.describe_transition('pending_upstream', 'fixed')
+
+        assert first is second
+        with pytest.raises(TypeError):
+            first['is_valid'] = False
+
     def test_custom_state_configuration(self):
         """Should support custom state definitions."""
         config = {
@@ -8,51 +8,28 @@ These tests validate core functionality without heavy mocking:
 
 Note: State history tracking is handled by dbt snapshots (Phase 4).
 """
-import tempfile
-from datetime import datetime
-from pathlib import Path
+import json
 
+import duckdb
 import pytest
 
-from storage import Database, SourceLoader
-from ingestion.base_adapter import SourceObservation
-
-
-@pytest.fixture
-def temp_db():
-    """Temporary database for testing."""
-    # Create temp file and delete it immediately
-    # DuckDB will create the actual database file
-    with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=True) as f:
-        db_path = f.name
+import storage.loader
 
-    db = Database(db_path)
-    db.initialize_schema()
-    yield db
-    db.close()
-
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
+from ingestion.base_adapter import SourceObservation
+from storage import Database
+from _fixtures import NOW
 
 
 def test_database_initialization(temp_db):
     """Verify database schema is created correctly."""
-    conn = temp_db.connect()
-
-    # Check all expected tables exist
-    tables = conn.execute("""
-        SELECT table_name FROM information_schema.tables
-        WHERE table_schema = 'main'
-    """).fetchall()
+    assert temp_db.verify_schema()
 
-    table_names = {t[0] for t in tables}
 
-    assert "raw_echo_advisories" in table_names
-    assert "raw_echo_csv" in table_names
-    assert "raw_nvd_observations" in table_names
-    assert "raw_osv_observations" in table_names
-    assert "advisory_state_history" in table_names
-    assert "pipeline_runs" in table_names
+def test_verify_schema_detects_missing_tables():
+    """Verify schema check fails before initialization."""
+    db = Database(":memory:")
+    assert not db.verify_schema()
+    db.close()
 
 
 def test_run_id_generation(temp_db):
@@ -62,17 +39,15 @@ def test_run_id_generation(temp_db):
     assert len(run_id) == 19  # run_YYYYMMDD_HHMMSS
 
 
-def test_loader_echo_advisories(temp_db):
+def test_loader_echo_advisories(temp_db, loader):
     """Test loading Echo advisories."""
-    loader = SourceLoader(temp_db)
-
     observations = [
         SourceObservation(
             observation_id="obs_001",
             source_id="echo_data",
             cve_id="CVE-2024-0001",
             package_name="test-package",
-            observed_at=datetime.utcnow(),
+            observed_at=NOW,
             raw_payload={"test": "data"},
             status="open",
             cvss_score=7.5,
@@ -94,9 +69,8 @@ def test_loader_echo_advisories(temp_db):
     assert len(result) == 1
 
 
-def test_loader_idempotency(temp_db):
+def test_loader_idempotency(temp_db, loader):
     """Test that loading twice with same run_id replaces data."""
-    loader = SourceLoader(temp_db)
     run_id = "run_test_002"
 
     obs1 = [SourceObservation(
@@ -104,7 +78,7 @@ def test_loader_idempotency(temp_db):
         source_id="echo_data",
         cve_id="CVE-2024-0001",
         package_name="pkg1",
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -113,7 +87,7 @@ def test_loader_idempotency(temp_db):
         source_id="echo_data",
         cve_id="CVE-2024-0002",
         package_name="pkg2",
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -133,9 +107,88 @@ def test_loader_idempotency(temp_db):
     assert result[0][0] == "obs_002"
 
 
-def test_loader_all_sources(temp_db):
+def test_loader_echo_advisories_rows(temp_db, loader):
+    """Test loading pre-built row tuples without SourceObservation instances."""
+    run_id = "run_test_005"
+
+    rows = [
+        (f"obs_{i:03d}", f"CVE-2024-{i:04d}", "pkg", NOW, {}, "pending", False, None, 5.0, None)
+        for i in range(100)
+    ]
+
+    count = loader.load_echo_advisories_rows(rows, run_id)
+    assert count == 100
+
+    conn = temp_db.connect()
+    result = conn.execute("""
+        SELECT COUNT(*), MIN(observation_id), MAX(cvss_score)
+        FROM raw_echo_advisories WHERE run_id = ?
+    """, [run_id]).fetchone()
+
+    assert result == (100, "obs_000", 5.0)
+
+
+@pytest.mark.parametrize("row", [
+    pytest.param(
+        ("obs_001", "CVE-2024-0001", "pkg", NOW, {}, "pending", False, None, 5.0, None, "EXTRA"),
+        id="too_long"
+    ),
+    pytest.param(
+        ("obs_001", "CVE-2024-0001", "pkg", NOW, {}, "pending", False, None, 5.0),
+        id="too_short"
+    ),
+])
+def test_loader_echo_advisories_rows_rejects_wrong_width(temp_db, loader, row):
+    """Test rows of the wrong width are rejected before the table is cleared."""
+    good = ("obs_000", "CVE-2024-0000", "pkg", NOW, {}, "pending", False, None, 5.0, None)
+    loader.load_echo_advisories_rows([good], "run_test_007")
+
+    with pytest.raises(ValueError, match="expected 10"):
+        loader.load_echo_advisories_rows([good, row], "run_test_008")
+
+    conn = temp_db.connect()
+    result = conn.execute("""
+        SELECT run_id FROM raw_echo_advisories
+    """).fetchall()
+
+    assert result == [("run_test_007",)]
+
+
+@pytest.mark.parametrize("use_orjson", [
+    pytest.param(True, id="orjson"),
+    pytest.param(False, id="json_fallback"),
+])
+def test_loader_non_finite_floats_stored_as_null(temp_db, loader, monkeypatch, use_orjson):
+    """Test NaN and infinity load as NULL with either JSON encoder."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(storage.loader, "orjson", None)
+
+    obs = [SourceObservation(
+        observation_id="obs_nan",
+        source_id="echo_data",
+        cve_id="CVE-2024-0003",
+        package_name="pkg",
+        observed_at=NOW,
+        raw_payload={"score": float("nan"), "bounds": [float("-inf"), 1.5]},
+        cvss_score=float("inf")
+    )]
+
+    loader.load_echo_advisories(obs, "run_test_006")
+
+    conn = temp_db.connect()
+    cvss_score, raw_payload = conn.execute("""
+        SELECT cvss_score, raw_payload FROM raw_echo_advisories
+        WHERE observation_id = 'obs_nan'
+    """).fetchone()
+
+    assert cvss_score is None
+    assert json.loads(raw_payload) == {"score": None, "bounds": [None, 1.5]}
+
+
+def test_loader_all_sources(temp_db, loader):
     """Test loading observations from all sources."""
-    loader = SourceLoader(temp_db)
     run_id = "run_test_003"
 
     echo_obs = [SourceObservation(
@@ -143,7 +196,7 @@ def test_loader_all_sources(temp_db):
         source_id="echo_data",
         cve_id="CVE-2024-0001",
         package_name="pkg1",
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -152,7 +205,7 @@ def test_loader_all_sources(temp_db):
         source_id="echo_csv",
         cve_id="CVE-2024-0002",
         package_name="pkg2",
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -161,7 +214,7 @@ def test_loader_all_sources(temp_db):
         source_id="nvd",
         cve_id="CVE-2024-0003",
         package_name=None,
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -170,7 +223,7 @@ def test_loader_all_sources(temp_db):
         source_id="osv",
         cve_id="CVE-2024-0004",
         package_name="pkg4",
-        observed_at=datetime.utcnow(),
+        observed_at=NOW,
         raw_payload={}
     )]
 
@@ -205,3 +258,37 @@ def test_loader_all_sources(temp_db):
         "SELECT COUNT(*) FROM raw_osv_observations WHERE run_id = ?", [run_id]
     ).fetchone()[0]
     assert osv_result == 1
+
+
+def test_loader_all_sources_rolls_back_on_failure(temp_db, loader):
+    """Test load_all leaves every raw table untouched if one source fails."""
+
+    def make_obs(observation_id, source_id):
+        return SourceObservation(
+            observation_id=observation_id,
+            source_id=source_id,
+            cve_id="CVE-2024-0001",
+            package_name="pkg1",
+            observed_at=NOW,
+            raw_payload={}
+        )
+
+    loader.load_echo_advisories([make_obs("echo_001", "echo_data")], "run_test_004")
+
+    # Duplicate observation_id violates the OSV primary key after the other
+    # three tables have already been written inside the transaction
+    duplicate_osv = [make_obs("osv_001", "osv"), make_obs("osv_001", "osv")]
+    with pytest.raises(duckdb.ConstraintException):
+        loader.load_all(
+            [make_obs("echo_002", "echo_data")],
+            [make_obs("csv_001", "echo_csv")],
+            [],
+            duplicate_osv,
+            "run_test_005"
+        )
+
+    conn = temp_db.connect()
+    echo_ids = conn.execute("SELECT observation_id FROM raw_echo_advisories").fetchall()
+    assert echo_ids == [("echo_001",)]
+    assert conn.execute("SELECT COUNT(*) FROM raw_echo_csv").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM raw_osv_observations").fetchone()[0] == 0